@@ -0,0 +1,28 @@
+"""add scheduling_rules.energy_profile_json
+
+Revision ID: 7c3e9f2a1d04
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e9f2a1d04"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scheduling_rules", sa.Column("energy_profile_json", sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("scheduling_rules", "energy_profile_json")
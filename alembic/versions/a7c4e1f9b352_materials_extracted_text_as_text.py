@@ -0,0 +1,41 @@
+"""materials.extracted_text VARCHAR -> TEXT
+
+Revision ID: a7c4e1f9b352
+Revises: f3b6d9e2a471
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e1f9b352"
+down_revision: Union[str, None] = "f3b6d9e2a471"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Unbounded VARCHAR and TEXT share a storage format in Postgres, so
+    # this is a catalog change, not a table rewrite
+    op.alter_column(
+        "materials",
+        "extracted_text",
+        existing_type=sqlmodel.sql.sqltypes.AutoString(),
+        type_=sa.Text(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "materials",
+        "extracted_text",
+        existing_type=sa.Text(),
+        type_=sqlmodel.sql.sqltypes.AutoString(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,42 @@
+"""chat_messages.tool_calls to jsonb
+
+Revision ID: b8d41e6f0c27
+Revises: 7c3e9f2a1d04
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d41e6f0c27"
+down_revision: Union[str, None] = "7c3e9f2a1d04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows without tool calls were stored as '' which is not valid JSON
+    op.alter_column(
+        "chat_messages",
+        "tool_calls",
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using="NULLIF(tool_calls, '')::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "chat_messages",
+        "tool_calls",
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="COALESCE(tool_calls::text, '')",
+    )
@@ -0,0 +1,62 @@
+"""server-side defaults for the remaining created_at/updated_at columns
+
+Revision ID: b9e2d5a8c163
+Revises: a7c4e1f9b352
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e2d5a8c163"
+down_revision: Union[str, None] = "a7c4e1f9b352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = [
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("courses", "created_at"),
+    ("courses", "updated_at"),
+    ("tasks", "created_at"),
+    ("tasks", "updated_at"),
+    ("study_blocks", "created_at"),
+    ("study_blocks", "updated_at"),
+    ("tags", "created_at"),
+    ("materials", "created_at"),
+    ("plan_versions", "created_at"),
+    ("insights", "created_at"),
+    ("time_logs", "created_at"),
+    ("sharing_rules", "created_at"),
+    ("scheduling_rules", "updated_at"),
+    ("study_groups", "created_at"),
+    ("study_groups", "updated_at"),
+    ("study_group_members", "joined_at"),
+]
+
+
+def upgrade() -> None:
+    # Same expression app.models.defaults.UtcNow compiles to on Postgres
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("TIMEZONE('utc', clock_timestamp())"),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
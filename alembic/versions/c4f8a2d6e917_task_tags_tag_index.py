@@ -0,0 +1,25 @@
+"""task_tags (tag_id, task_id) index
+
+Revision ID: c4f8a2d6e917
+Revises: b9e2d5a8c163
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f8a2d6e917"
+down_revision: Union[str, None] = "b9e2d5a8c163"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_task_tags_tag_task", "task_tags", ["tag_id", "task_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_tags_tag_task", table_name="task_tags")
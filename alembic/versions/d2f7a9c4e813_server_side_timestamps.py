@@ -0,0 +1,49 @@
+"""server-side defaults for chat, calendar binding and availability timestamps
+
+Revision ID: d2f7a9c4e813
+Revises: b8d41e6f0c27
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f7a9c4e813"
+down_revision: Union[str, None] = "b8d41e6f0c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = [
+    ("chat_sessions", "created_at"),
+    ("chat_sessions", "updated_at"),
+    ("chat_messages", "created_at"),
+    ("calendar_bindings", "created_at"),
+    ("availability_grids", "updated_at"),
+]
+
+
+def upgrade() -> None:
+    # Same expression app.models.defaults.UtcNow compiles to on Postgres
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("TIMEZONE('utc', clock_timestamp())"),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
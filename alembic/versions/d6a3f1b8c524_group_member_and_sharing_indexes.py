@@ -0,0 +1,54 @@
+"""study_group_members (group_id, user_id) unique index; sharing_rules lookup indexes
+
+Revision ID: d6a3f1b8c524
+Revises: c4f8a2d6e917
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6a3f1b8c524"
+down_revision: Union[str, None] = "c4f8a2d6e917"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Concurrent adds could have slipped past the app-level check; keep the
+    # earliest membership of any duplicate pair
+    op.execute(
+        "DELETE FROM study_group_members a USING study_group_members b "
+        "WHERE a.group_id = b.group_id AND a.user_id = b.user_id AND a.id > b.id"
+    )
+    op.create_index(
+        "uq_study_group_members_group_user",
+        "study_group_members",
+        ["group_id", "user_id"],
+        unique=True,
+    )
+    op.drop_index("ix_study_group_members_group_id", table_name="study_group_members")
+    op.create_index(
+        "ix_sharing_rules_active_shared_with_id",
+        "sharing_rules",
+        ["is_active", "shared_with_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_sharing_rules_active_shared_with_email",
+        "sharing_rules",
+        ["is_active", "shared_with_email"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sharing_rules_active_shared_with_email", table_name="sharing_rules")
+    op.drop_index("ix_sharing_rules_active_shared_with_id", table_name="sharing_rules")
+    op.create_index(
+        "ix_study_group_members_group_id", "study_group_members", ["group_id"], unique=False
+    )
+    op.drop_index("uq_study_group_members_group_user", table_name="study_group_members")
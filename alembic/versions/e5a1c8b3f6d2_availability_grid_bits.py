@@ -0,0 +1,72 @@
+"""availability_grids.grid JSON -> grid_bits bytea
+
+Revision ID: e5a1c8b3f6d2
+Revises: d2f7a9c4e813
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a1c8b3f6d2"
+down_revision: Union[str, None] = "d2f7a9c4e813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the storage layout (app.services.availability_cache)
+_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+_SLOTS = 96
+_DAY_BYTES = _SLOTS // 8
+
+
+def _pack(grid: dict) -> bytes:
+    out = b""
+    for day in _DAYS:
+        mask = 0
+        for slot, free in enumerate(grid.get(day, [])[:_SLOTS]):
+            if free:
+                mask |= 1 << slot
+        out += mask.to_bytes(_DAY_BYTES, "little")
+    return out
+
+
+def _unpack(bits: bytes) -> dict:
+    grid = {}
+    for i, day in enumerate(_DAYS):
+        mask = int.from_bytes(bits[i * _DAY_BYTES:(i + 1) * _DAY_BYTES], "little")
+        grid[day] = [bool(mask >> slot & 1) for slot in range(_SLOTS)]
+    return grid
+
+
+def upgrade() -> None:
+    op.add_column("availability_grids", sa.Column("grid_bits", sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, grid FROM availability_grids")).fetchall()
+    for row_id, grid in rows:
+        conn.execute(
+            sa.text("UPDATE availability_grids SET grid_bits = :bits WHERE id = :id"),
+            {"bits": _pack(json.loads(grid or "{}")), "id": row_id},
+        )
+
+    op.alter_column("availability_grids", "grid_bits", nullable=False)
+    op.drop_column("availability_grids", "grid")
+
+
+def downgrade() -> None:
+    op.add_column("availability_grids", sa.Column("grid", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, grid_bits FROM availability_grids")).fetchall()
+    for row_id, bits in rows:
+        conn.execute(
+            sa.text("UPDATE availability_grids SET grid = :grid WHERE id = :id"),
+            {"grid": json.dumps(_unpack(bytes(bits))), "id": row_id},
+        )
+
+    op.drop_column("availability_grids", "grid_bits")
@@ -0,0 +1,55 @@
+"""lms_connections table for stored Canvas/Moodle credentials (Fernet-encrypted)
+
+Revision ID: e8b5c2f7a419
+Revises: d6a3f1b8c524
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b5c2f7a419"
+down_revision: Union[str, None] = "d6a3f1b8c524"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lms_connections",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("provider", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        # Fernet token of the credentials JSON (app.models.encrypted.EncryptedJSON)
+        sa.Column("credentials", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', clock_timestamp())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', clock_timestamp())"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_lms_connections_user_provider",
+        "lms_connections",
+        ["user_id", "provider"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_lms_connections_user_provider", table_name="lms_connections")
+    op.drop_table("lms_connections")
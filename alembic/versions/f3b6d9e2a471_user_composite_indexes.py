@@ -0,0 +1,37 @@
+"""composite (user_id, ...) indexes on study_blocks and tasks
+
+Revision ID: f3b6d9e2a471
+Revises: e5a1c8b3f6d2
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b6d9e2a471"
+down_revision: Union[str, None] = "e5a1c8b3f6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_study_blocks_user_start", "study_blocks", ["user_id", "start"], unique=False
+    )
+    op.drop_index("ix_study_blocks_user_id", table_name="study_blocks")
+    op.create_index("ix_tasks_user_due", "tasks", ["user_id", "due_date"], unique=False)
+    op.create_index(
+        "ix_tasks_user_status_due", "tasks", ["user_id", "status", "due_date"], unique=False
+    )
+    op.drop_index("ix_tasks_user_id", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index("ix_tasks_user_id", "tasks", ["user_id"], unique=False)
+    op.drop_index("ix_tasks_user_status_due", table_name="tasks")
+    op.drop_index("ix_tasks_user_due", table_name="tasks")
+    op.create_index("ix_study_blocks_user_id", "study_blocks", ["user_id"], unique=False)
+    op.drop_index("ix_study_blocks_user_start", table_name="study_blocks")
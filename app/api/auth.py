@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 
-from app.core.database import get_session
-from app.core.deps import CurrentUser
-from app.core.rate_limit import limiter
+from app.core.deps import CurrentUser, DbSession
 from app.core.security import verify_supabase_token
+from app.models.defaults import UtcNow
 from app.models.user import User
 from app.schemas.auth import ProvisionRequest, UserResponse
 
@@ -13,14 +12,12 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/provision", response_model=UserResponse)
-@limiter.limit("10/minute")
 async def provision(
-    request: Request,
     body: ProvisionRequest,
-    session: AsyncSession = Depends(get_session),
+    session: DbSession,
 ):
     """Called by frontend after Supabase sign-in. Upserts public.users from JWT claims."""
-    payload = verify_supabase_token(body.access_token)
+    payload = await verify_supabase_token(body.access_token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -33,42 +30,41 @@ async def provision(
     display_name = user_metadata.get("full_name", user_metadata.get("name", ""))
     avatar_url = user_metadata.get("avatar_url", user_metadata.get("picture", ""))
 
-    result = await session.execute(select(User).where(User.supabase_id == sub))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        user = User(
-            email=email,
-            display_name=display_name,
-            avatar_url=avatar_url,
-            supabase_id=sub,
-        )
-        session.add(user)
-    else:
-        user.email = email
-        user.display_name = display_name or user.display_name
-        user.avatar_url = avatar_url or user.avatar_url
-
+    # Single round-trip upsert returning only the UserResponse columns;
+    # blank claims keep the stored value
+    stmt = insert(User).values(
+        email=email,
+        display_name=display_name,
+        avatar_url=avatar_url,
+        supabase_id=sub,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.supabase_id],
+        set_={
+            "email": stmt.excluded.email,
+            "display_name": func.coalesce(
+                func.nullif(stmt.excluded.display_name, ""), User.display_name
+            ),
+            "avatar_url": func.coalesce(
+                func.nullif(stmt.excluded.avatar_url, ""), User.avatar_url
+            ),
+            # Column onupdate isn't applied on the ON CONFLICT path
+            "updated_at": UtcNow(),
+        },
+    ).returning(
+        User.id,
+        User.email,
+        User.display_name,
+        User.avatar_url,
+        User.timezone,
+        User.study_calendar_id,
+    )
+    row = (await session.execute(stmt)).one()
     await session.commit()
-    await session.refresh(user)
 
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        avatar_url=user.avatar_url,
-        timezone=user.timezone,
-        study_calendar_id=user.study_calendar_id,
-    )
+    return row
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(user: CurrentUser):
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        avatar_url=user.avatar_url,
-        timezone=user.timezone,
-        study_calendar_id=user.study_calendar_id,
-    )
+    return user
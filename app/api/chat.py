@@ -1,5 +1,6 @@
-import json
+from datetime import datetime
 
+import orjson
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
@@ -10,6 +11,9 @@ from app.services.llm import chat_service
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+_SSE_PREFIX = b"data: "
+_SSE_END = b"\n\n"
+
 
 @router.post("", response_model=ChatMessageResponse)
 @limiter.limit("20/minute")
@@ -25,7 +29,7 @@ async def send_message(request: Request, data: ChatRequest, user: CurrentUser, s
         tool_calls=[
             ToolCallInfo(name=tc["name"], arguments=tc["arguments"]) for tc in tool_calls
         ],
-        created_at=__import__("datetime").datetime.utcnow(),
+        created_at=datetime.utcnow(),
     )
 
 
@@ -34,19 +38,10 @@ async def send_message_stream(data: ChatRequest, user: CurrentUser, session: DbS
     """SSE streaming endpoint for chat responses."""
 
     async def event_generator():
-        response_text, tool_calls, session_id = await chat_service.chat(
+        async for event in chat_service.chat_stream(
             session, user.id, data.message, data.session_id
-        )
-
-        # Send text chunks
-        yield f"data: {json.dumps({'type': 'text', 'content': response_text})}\n\n"
-
-        # Send tool calls
-        for tc in tool_calls:
-            yield f"data: {json.dumps({'type': 'tool_call', 'name': tc['name'], 'arguments': tc['arguments']})}\n\n"
-
-        # Done
-        yield f"data: {json.dumps({'type': 'done', 'session_id': session_id})}\n\n"
+        ):
+            yield _SSE_PREFIX + orjson.dumps(event) + _SSE_END
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -60,42 +55,20 @@ async def get_history(
     if not session_id:
         return []
 
-    messages = await chat_service.get_chat_history(session, user.id, session_id)
-    return [
-        ChatMessageResponse(
-            id=m.id,
-            session_id=m.session_id,
-            role=m.role,
-            content=m.content,
-            tool_calls=(
-                [ToolCallInfo(**tc) for tc in json.loads(m.tool_calls)]
-                if m.tool_calls
-                else []
-            ),
-            created_at=m.created_at,
-        )
-        for m in messages
-    ]
+    # Validated and serialized straight from the ORM rows by response_model
+    return await chat_service.get_chat_history(session, user.id, session_id)
 
 
 @router.get("/sessions", response_model=list[ChatSessionResponse])
 async def get_sessions(user: CurrentUser, session: DbSession):
-    from sqlmodel import select
-    from app.models.chat import ChatSession
-
-    result = await session.execute(
-        select(ChatSession)
-        .where(ChatSession.user_id == user.id)
-        .order_by(ChatSession.updated_at.desc())
-    )
-    sessions = result.scalars().all()
+    rows = await chat_service.list_sessions(session, user.id)
     return [
         ChatSessionResponse(
-            id=s.id,
-            title=s.title,
-            is_active=s.is_active,
-            created_at=s.created_at,
-            updated_at=s.updated_at,
+            id=r.id,
+            title=r.title,
+            is_active=r.is_active,
+            created_at=r.created_at,
+            updated_at=r.updated_at,
         )
-        for s in sessions
+        for r in rows
     ]
@@ -26,8 +26,6 @@ from app.services.collab.study_groups import (
     list_groups,
     StudyGroupMember,
 )
-from app.models.user import User
-from sqlmodel import select
 
 router = APIRouter(tags=["collaboration"])
 
@@ -70,7 +68,7 @@ async def view_shared_schedule(
     session: DbSession,
 ):
     """View the schedule shared via a specific rule."""
-    return await get_shared_schedule(session, rule_id, user.id)
+    return await get_shared_schedule(session, rule_id, user)
 
 
 @router.delete("/api/sharing/{rule_id}", status_code=204)
@@ -120,20 +118,14 @@ async def add_member_to_group(
     session: DbSession,
 ):
     """Add a member to a study group by email."""
-    member = await add_group_member(session, group_id, user.id, data)
-
-    # Fetch the added user's details for the response
-    user_result = await session.execute(
-        select(User).where(User.id == member.user_id)
-    )
-    added_user = user_result.scalar_one_or_none()
+    member, added_user = await add_group_member(session, group_id, user.id, data)
 
     return MemberResponse(
         id=member.id,
         group_id=member.group_id,
         user_id=member.user_id,
-        display_name=added_user.display_name if added_user else "",
-        email=added_user.email if added_user else "",
+        display_name=added_user.display_name,
+        email=added_user.email,
         joined_at=member.joined_at,
     )
 
@@ -1,8 +1,15 @@
 """Energy profile API routes."""
 
+import json
+
 from fastapi import APIRouter
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
 from app.core.deps import CurrentUser, DbSession
+from app.models.availability import SchedulingRules
+from app.models.defaults import UtcNow
 from app.services.scheduler.energy import (
     EnergyProfile,
     EnergyProfileType,
@@ -11,70 +18,43 @@ from app.services.scheduler.energy import (
 
 router = APIRouter(prefix="/api/energy-profile", tags=["energy"])
 
+# Presets are fixed, so build them once instead of on every request
+_DEFAULT_PROFILES = get_default_profiles()
+_PRESETS_BY_VALUE = {k.value: v for k, v in _DEFAULT_PROFILES.items()}
 
-# ── In-DB persistence helpers ────────────────────────────────────────
-# Energy profiles are stored in the scheduling_rules table as a JSON
-# column.  Until a dedicated column is added via migration, we store
-# them in a lightweight key-value approach using the AvailabilityGrid
-# pattern: one JSON blob per user.
-
-import json
-
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
-from app.models.availability import SchedulingRules
+# ── In-DB persistence helpers ────────────────────────────────────────
+# Energy profiles are stored as a JSON blob in
+# scheduling_rules.energy_profile_json, one row per user.
 
 
 async def _get_profile(session: AsyncSession, user_id: int) -> EnergyProfile:
     """Load the user's energy profile, falling back to the balanced preset."""
     result = await session.execute(
-        select(SchedulingRules).where(SchedulingRules.user_id == user_id)
+        select(SchedulingRules.energy_profile_json).where(SchedulingRules.user_id == user_id)
     )
-    rules = result.scalar_one_or_none()
-
-    # We piggyback on a JSON-text field stored alongside scheduling rules.
-    # If no custom profile exists yet, return the balanced default.
-    if rules is None:
-        return get_default_profiles()[EnergyProfileType.BALANCED]
-
-    # Try to read from an extended attribute.  If the column doesn't exist
-    # yet we simply return the default.
-    raw = getattr(rules, "energy_profile_json", None)
+    raw = result.scalar_one_or_none()
     if raw:
         try:
             return EnergyProfile(**json.loads(raw))
         except Exception:
             pass
 
-    return get_default_profiles()[EnergyProfileType.BALANCED]
+    return _DEFAULT_PROFILES[EnergyProfileType.BALANCED]
 
 
 async def _save_profile(
     session: AsyncSession, user_id: int, profile: EnergyProfile
 ) -> None:
-    """Persist the energy profile.  Currently stored as an extended attr."""
-    result = await session.execute(
-        select(SchedulingRules).where(SchedulingRules.user_id == user_id)
-    )
-    rules = result.scalar_one_or_none()
+    """Persist the energy profile, creating the rules row if needed."""
     profile_json = json.dumps(profile.model_dump())
-
-    if rules is not None:
-        # If the model has the column, set it; otherwise it's a no-op
-        # until the migration is run.
-        try:
-            rules.energy_profile_json = profile_json  # type: ignore[attr-defined]
-        except AttributeError:
-            pass
-    else:
-        rules = SchedulingRules(user_id=user_id)
-        try:
-            rules.energy_profile_json = profile_json  # type: ignore[attr-defined]
-        except AttributeError:
-            pass
-        session.add(rules)
-
+    stmt = insert(SchedulingRules).values(user_id=user_id, energy_profile_json=profile_json)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SchedulingRules.user_id],
+        # Column onupdate isn't applied on the ON CONFLICT path
+        set_={"energy_profile_json": stmt.excluded.energy_profile_json, "updated_at": UtcNow()},
+    )
+    await session.execute(stmt)
     await session.commit()
 
 
@@ -99,5 +79,4 @@ async def update_energy_profile(
 @router.get("/presets", response_model=dict[str, EnergyProfile])
 async def list_presets():
     """Return the three built-in energy profile presets."""
-    profiles = get_default_profiles()
-    return {k.value: v for k, v in profiles.items()}
+    return _PRESETS_BY_VALUE
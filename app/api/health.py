@@ -1,25 +1,43 @@
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import engine
+from app.core.deps import DbSession, require_ops_token
 
 router = APIRouter(tags=["health"])
 
+# Liveness probes hit these constantly; serve pre-encoded bodies
+_HEALTHY = Response(content=b'{"status":"healthy"}', media_type="application/json")
+_DB_HEALTHY = Response(
+    content=b'{"status":"healthy","db":"connected"}', media_type="application/json"
+)
+
 
 @router.get("/health")
 async def health():
-    return {"status": "healthy"}
+    return _HEALTHY
 
 
 @router.get("/health/db")
-async def health_db(session: AsyncSession = Depends(get_session)):
+async def health_db(session: DbSession):
     try:
         await session.execute(text("SELECT 1"))
-        return {"status": "healthy", "db": "connected"}
+        return _DB_HEALTHY
     except Exception as e:
         return JSONResponse(
             status_code=503,
             content={"status": "unhealthy", "db": str(e)},
         )
+
+
+@router.get("/health/pool", dependencies=[Depends(require_ops_token)])
+async def health_pool():
+    """Live connection pool counters; ops-only (X-Ops-Token)."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
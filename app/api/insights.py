@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime, timedelta
 
 from fastapi import APIRouter, Query
 
@@ -15,10 +15,9 @@ async def get_weekly_insight(
     week_start: date = Query(default=None),
 ):
     if not week_start:
-        from datetime import datetime
         today = datetime.utcnow().date()
         # Monday of current week
-        week_start = today - __import__("datetime").timedelta(days=today.weekday())
+        week_start = today - timedelta(days=today.weekday())
 
     return await insights_service.compute_weekly_insight(session, user.id, week_start)
 
@@ -1,11 +1,23 @@
 """API routes for external integrations (LMS, Notion, Todoist, holidays)."""
 
-from datetime import date, datetime, timezone
+from datetime import date
 
+from celery.result import AsyncResult
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-
-from app.core.deps import CurrentUser, DbSession
+from sqlmodel import select
+from starlette.concurrency import run_in_threadpool
+
+from app.core.deps import CurrentUser, DbSession, HttpClient
+from app.models.lms_connection import LMSConnection
+from app.services.integrations.canvas import CanvasConnector
+from app.services.integrations.holiday_detection import (
+    detect_reduced_availability,
+    get_holidays,
+)
+from app.services.integrations.moodle import MoodleConnector
+from app.tasks.integration_tasks import run_lms_sync
+from app.tasks.worker import celery_app, is_owned_task_id, owned_task_id
 
 router = APIRouter(prefix="/api/integrations", tags=["integrations"])
 
@@ -32,6 +44,13 @@ class SyncResult(BaseModel):
     errors: list[str] = []
 
 
+class SyncJob(BaseModel):
+    job_id: str
+    status: str  # queued | running | completed | failed
+    status_url: str | None = None
+    result: SyncResult | None = None
+
+
 class HolidayEntry(BaseModel):
     date: str
     name: str
@@ -50,10 +69,16 @@ class ReducedAvailabilityEntry(BaseModel):
 @router.get("", response_model=list[IntegrationStatus])
 async def list_integrations(user: CurrentUser, session: DbSession):
     """List all available integrations and their connection status."""
-    # TODO: read real connection state from a user_integrations table
+    lms = set(
+        (
+            await session.execute(
+                select(LMSConnection.provider).where(LMSConnection.user_id == user.id)
+            )
+        ).scalars()
+    )
     integrations = [
-        IntegrationStatus(provider="canvas", connected=False),
-        IntegrationStatus(provider="moodle", connected=False),
+        IntegrationStatus(provider="canvas", connected="canvas" in lms),
+        IntegrationStatus(provider="moodle", connected="moodle" in lms),
         IntegrationStatus(provider="notion", connected=False),
         IntegrationStatus(provider="todoist", connected=False),
         IntegrationStatus(
@@ -64,15 +89,80 @@ async def list_integrations(user: CurrentUser, session: DbSession):
     return integrations
 
 
+# ---- LMS sync jobs ----
+
+
+async def _save_connection(
+    session: DbSession, provider: str, user_id: int, credentials: dict
+) -> None:
+    connection = (
+        await session.execute(
+            select(LMSConnection).where(
+                LMSConnection.user_id == user_id, LMSConnection.provider == provider
+            )
+        )
+    ).scalar_one_or_none()
+    if connection is None:
+        session.add(LMSConnection(user_id=user_id, provider=provider, credentials=credentials))
+    else:
+        connection.credentials = credentials
+    await session.commit()
+
+
+async def _queue_sync(session: DbSession, provider: str, user_id: int) -> SyncJob:
+    connection_id = (
+        await session.execute(
+            select(LMSConnection.id).where(
+                LMSConnection.user_id == user_id, LMSConnection.provider == provider
+            )
+        )
+    ).scalar_one_or_none()
+    if connection_id is None:
+        raise HTTPException(
+            status_code=400, detail=f"Connect {provider.capitalize()} before syncing."
+        )
+
+    # Only the connection id goes through the broker; the task loads the
+    # credentials. Publishing is blocking Redis I/O
+    job_id = owned_task_id(user_id, provider)
+    await run_in_threadpool(
+        run_lms_sync.apply_async, (provider, user_id, connection_id), task_id=job_id
+    )
+    return SyncJob(
+        job_id=job_id,
+        status="queued",
+        status_url=f"/api/integrations/{provider}/sync/{job_id}",
+    )
+
+
+_JOB_STATUS = {"SUCCESS": "completed", "FAILURE": "failed", "STARTED": "running"}
+
+
+async def _sync_status(provider: str, user_id: int, job_id: str) -> SyncJob:
+    if not is_owned_task_id(job_id, user_id, provider):
+        raise HTTPException(status_code=404, detail="Sync job not found")
+
+    def read() -> tuple[str, object]:
+        job = AsyncResult(job_id, app=celery_app)
+        return job.state, job.result
+
+    # Reading the result backend is blocking Redis I/O
+    state, result = await run_in_threadpool(read)
+    status = _JOB_STATUS.get(state, "queued")
+    if status != "completed":
+        return SyncJob(job_id=job_id, status=status)
+    return SyncJob(job_id=job_id, status=status, result=SyncResult(**result))
+
+
 # ---- Canvas ----
 
 
 @router.post("/canvas/connect")
-async def connect_canvas(data: LMSConnectRequest, user: CurrentUser, session: DbSession):
+async def connect_canvas(
+    data: LMSConnectRequest, user: CurrentUser, session: DbSession, http: HttpClient
+):
     """Connect a Canvas LMS instance."""
-    from app.services.integrations.canvas import CanvasConnector
-
-    connector = CanvasConnector()
+    connector = CanvasConnector(http)
     credentials = {
         "base_url": data.base_url,
         "api_token": data.api_token or "",
@@ -84,47 +174,30 @@ async def connect_canvas(data: LMSConnectRequest, user: CurrentUser, session: Db
             detail="Failed to authenticate with Canvas. Check your base URL and API token.",
         )
 
-    # TODO: persist the connection in a user_integrations table
+    await _save_connection(session, "canvas", user.id, credentials)
     return {"status": "connected", "provider": "canvas"}
 
 
-@router.post("/canvas/sync", response_model=SyncResult)
-async def sync_canvas(data: LMSConnectRequest, user: CurrentUser, session: DbSession):
-    """Trigger a sync of courses and assignments from Canvas."""
-    from app.services.integrations.canvas import CanvasConnector
+@router.post("/canvas/sync", response_model=SyncJob, status_code=202)
+async def sync_canvas(user: CurrentUser, session: DbSession):
+    """Queue a sync of courses and assignments from Canvas; poll the status URL."""
+    return await _queue_sync(session, "canvas", user.id)
 
-    connector = CanvasConnector()
-    credentials = {
-        "base_url": data.base_url,
-        "api_token": data.api_token or "",
-    }
-    authenticated = await connector.authenticate(credentials)
-    if not authenticated:
-        raise HTTPException(status_code=400, detail="Canvas authentication failed.")
-
-    courses = await connector.fetch_courses()
-    assignments = await connector.fetch_assignments()
 
-    # TODO: upsert courses and assignments into BrainyBuddy DB
-    errors: list[str] = []
-
-    return SyncResult(
-        provider="canvas",
-        courses_synced=len(courses),
-        assignments_synced=len(assignments),
-        errors=errors,
-    )
+@router.get("/canvas/sync/{job_id}", response_model=SyncJob)
+async def sync_canvas_status(job_id: str, user: CurrentUser):
+    return await _sync_status("canvas", user.id, job_id)
 
 
 # ---- Moodle ----
 
 
 @router.post("/moodle/connect")
-async def connect_moodle(data: LMSConnectRequest, user: CurrentUser, session: DbSession):
+async def connect_moodle(
+    data: LMSConnectRequest, user: CurrentUser, session: DbSession, http: HttpClient
+):
     """Connect a Moodle LMS instance."""
-    from app.services.integrations.moodle import MoodleConnector
-
-    connector = MoodleConnector()
+    connector = MoodleConnector(http)
     credentials = {
         "base_url": data.base_url,
         "token": data.token or "",
@@ -136,36 +209,19 @@ async def connect_moodle(data: LMSConnectRequest, user: CurrentUser, session: Db
             detail="Failed to authenticate with Moodle. Check your base URL and token.",
         )
 
-    # TODO: persist the connection in a user_integrations table
+    await _save_connection(session, "moodle", user.id, credentials)
     return {"status": "connected", "provider": "moodle"}
 
 
-@router.post("/moodle/sync", response_model=SyncResult)
-async def sync_moodle(data: LMSConnectRequest, user: CurrentUser, session: DbSession):
-    """Trigger a sync of courses and assignments from Moodle."""
-    from app.services.integrations.moodle import MoodleConnector
+@router.post("/moodle/sync", response_model=SyncJob, status_code=202)
+async def sync_moodle(user: CurrentUser, session: DbSession):
+    """Queue a sync of courses and assignments from Moodle; poll the status URL."""
+    return await _queue_sync(session, "moodle", user.id)
 
-    connector = MoodleConnector()
-    credentials = {
-        "base_url": data.base_url,
-        "token": data.token or "",
-    }
-    authenticated = await connector.authenticate(credentials)
-    if not authenticated:
-        raise HTTPException(status_code=400, detail="Moodle authentication failed.")
 
-    courses = await connector.fetch_courses()
-    assignments = await connector.fetch_assignments()
-
-    # TODO: upsert courses and assignments into BrainyBuddy DB
-    errors: list[str] = []
-
-    return SyncResult(
-        provider="moodle",
-        courses_synced=len(courses),
-        assignments_synced=len(assignments),
-        errors=errors,
-    )
+@router.get("/moodle/sync/{job_id}", response_model=SyncJob)
+async def sync_moodle_status(job_id: str, user: CurrentUser):
+    return await _sync_status("moodle", user.id, job_id)
 
 
 # ---- Holidays ----
@@ -180,10 +236,8 @@ async def get_holidays_endpoint(
     state: str | None = Query(default=None),
 ):
     """Get public holidays for a country and year."""
-    from app.services.integrations.holiday_detection import get_holidays
-
     if year is None:
-        year = datetime.now(timezone.utc).year
+        year = date.today().year
 
     holiday_list = get_holidays(country=country, year=year, state=state)
     return [HolidayEntry(date=h["date"], name=h["name"]) for h in holiday_list]
@@ -199,8 +253,6 @@ async def get_reduced_availability(
     state: str | None = Query(default=None),
 ):
     """Detect dates with reduced study availability (holidays, travel, breaks)."""
-    from app.services.integrations.holiday_detection import detect_reduced_availability
-
     if end_date < start_date:
         raise HTTPException(status_code=400, detail="end_date must be after start_date")
 
@@ -1,9 +1,21 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+import os
+
+import orjson
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.orm import undefer
+from sqlmodel import select
 
 from app.core.deps import CurrentUser, DbSession
 from app.models.material import ExtractionStatus, Material
+from app.models.task import Task
 from app.schemas.material import ExtractionConfirm, ExtractionResult, MaterialResponse
-from app.services.ingestion.extractor import extract_from_text, extract_syllabus
+from app.services.ingestion.extractor import (
+    extract_from_text,
+    extract_from_text_stream,
+    extract_syllabus,
+)
 from app.services.ingestion.parser import extract_text
 
 router = APIRouter(prefix="/api/materials", tags=["materials"])
@@ -16,35 +28,53 @@ async def upload_material(
     file: UploadFile = File(...),
     course_id: int | None = Form(None),
 ):
-    contents = await file.read()
+    # The upload is already spooled to a temp file (on disk past 1 MiB);
+    # measure and parse it in place instead of reading it into memory
+    file.file.seek(0, os.SEEK_END)
+    file_size = file.file.tell()
+    file.file.seek(0)
 
     material = Material(
         user_id=user.id,
         course_id=course_id,
         filename=file.filename or "unnamed",
         content_type=file.content_type or "",
-        file_size=len(contents),
+        file_size=file_size,
         extraction_status=ExtractionStatus.PROCESSING,
     )
     session.add(material)
     await session.flush()
 
     # Extract text
-    text = await extract_text(contents, file.content_type or "")
+    text = await extract_text(file.file, file.content_type or "")
     material.extracted_text = text
     material.extraction_status = ExtractionStatus.COMPLETED if text else ExtractionStatus.FAILED
     await session.commit()
-    await session.refresh(material)
 
     return material
 
 
-@router.post("/extract/{material_id}", response_model=ExtractionResult)
-async def extract_material(material_id: int, user: CurrentUser, session: DbSession):
-    from sqlmodel import select
+def _extraction_result(material: Material, extracted: dict) -> ExtractionResult:
+    return ExtractionResult(
+        material_id=material.id,
+        extracted_tasks=extracted.get("tasks", []),
+        extracted_events=extracted.get("events", []),
+        confidence=extracted.get("confidence", 0),
+        raw_text_preview=material.extracted_text[:500],
+    )
 
+
+@router.post("/extract/{material_id}", response_model=ExtractionResult)
+async def extract_material(
+    material_id: int,
+    user: CurrentUser,
+    session: DbSession,
+    stream: bool = Query(False),
+):
     result = await session.execute(
-        select(Material).where(Material.id == material_id, Material.user_id == user.id)
+        select(Material)
+        .where(Material.id == material_id, Material.user_id == user.id)
+        .options(undefer(Material.extracted_text))
     )
     material = result.scalar_one_or_none()
     if not material:
@@ -53,67 +83,64 @@ async def extract_material(material_id: int, user: CurrentUser, session: DbSessi
     if not material.extracted_text:
         raise HTTPException(status_code=400, detail="No text extracted from this material")
 
+    if stream:
+        # NDJSON: text deltas while Claude is writing, then the parsed result
+        async def event_generator():
+            async for event in extract_from_text_stream(material.extracted_text):
+                if event["type"] == "result":
+                    result = _extraction_result(material, event["data"])
+                    event = {"type": "result", **result.model_dump()}
+                yield orjson.dumps(event) + b"\n"
+
+        return StreamingResponse(event_generator(), media_type="application/x-ndjson")
+
     # Use Claude to extract structured data
     extracted = await extract_from_text(material.extracted_text)
-
-    return ExtractionResult(
-        material_id=material.id,
-        extracted_tasks=extracted.get("tasks", []),
-        extracted_events=extracted.get("events", []),
-        confidence=extracted.get("confidence", 0),
-        raw_text_preview=material.extracted_text[:500],
-    )
+    return _extraction_result(material, extracted)
 
 
 @router.post("/extract-syllabus/{material_id}", response_model=ExtractionResult)
 async def extract_syllabus_endpoint(material_id: int, user: CurrentUser, session: DbSession):
-    from sqlmodel import select
-
     result = await session.execute(
-        select(Material).where(Material.id == material_id, Material.user_id == user.id)
+        select(Material)
+        .where(Material.id == material_id, Material.user_id == user.id)
+        .options(undefer(Material.extracted_text))
     )
     material = result.scalar_one_or_none()
     if not material:
         raise HTTPException(status_code=404, detail="Material not found")
 
     extracted = await extract_syllabus(material.extracted_text)
-
-    return ExtractionResult(
-        material_id=material.id,
-        extracted_tasks=extracted.get("tasks", []),
-        extracted_events=extracted.get("events", []),
-        confidence=extracted.get("confidence", 0),
-        raw_text_preview=material.extracted_text[:500],
-    )
+    return _extraction_result(material, extracted)
 
 
 @router.post("/confirm-extraction")
 async def confirm_extraction(data: ExtractionConfirm, user: CurrentUser, session: DbSession):
     """Create tasks from confirmed extraction results."""
-    from app.models.task import Task
-
-    created_tasks = []
-    for task_data in data.tasks_to_create:
-        task = Task(
-            user_id=user.id,
-            title=task_data.get("title", "Untitled"),
-            due_date=task_data.get("due_date"),
-            estimated_hours=task_data.get("estimated_hours"),
-            difficulty=task_data.get("difficulty", 3),
-            task_type=task_data.get("task_type", "assignment"),
-            description=task_data.get("description", ""),
-        )
-        session.add(task)
-        created_tasks.append(task_data.get("title"))
-
+    rows = [
+        {
+            "user_id": user.id,
+            "title": task_data.get("title", "Untitled"),
+            "due_date": task_data.get("due_date"),
+            "estimated_hours": task_data.get("estimated_hours"),
+            "difficulty": task_data.get("difficulty", 3),
+            "task_type": task_data.get("task_type", "assignment"),
+            "description": task_data.get("description", ""),
+        }
+        for task_data in data.tasks_to_create
+    ]
+    if not rows:
+        return {"created": 0, "task_titles": []}
+
+    # One multi-row INSERT instead of a statement per task
+    result = await session.execute(insert(Task).values(rows).returning(Task.title))
+    created_titles = list(result.scalars().all())
     await session.commit()
-    return {"created": len(created_tasks), "task_titles": created_tasks}
+    return {"created": len(created_titles), "task_titles": created_titles}
 
 
 @router.get("", response_model=list[MaterialResponse])
 async def list_materials(user: CurrentUser, session: DbSession):
-    from sqlmodel import select
-
     result = await session.execute(
         select(Material).where(Material.user_id == user.id).order_by(Material.created_at.desc())
     )
@@ -1,9 +1,13 @@
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
-from app.core.deps import CurrentUser, DbSession
+from app.core.deps import CurrentUser, DbSession, RedisClient
+from app.core.etag import compute_etag, etag_matches
 from app.core.rate_limit import limiter
+from app.models.course import Course
+from app.models.study_block import StudyBlock
+from app.models.task import Task
 from app.schemas.schedule import (
     GeneratePlanRequest,
     MoveBlockRequest,
@@ -16,23 +20,26 @@ from app.services.plan_versioning import list_plan_versions, rollback_to_version
 
 router = APIRouter(prefix="/api/schedule", tags=["schedule"])
 
-# Temporary storage for previewed plans (in production, use Redis)
-_preview_cache: dict[int, list] = {}
-
 
 @router.post("/generate", response_model=PlanDiffResponse)
 @limiter.limit("5/minute")
-async def generate_plan(request: Request, data: GeneratePlanRequest, user: CurrentUser, session: DbSession):
+async def generate_plan(
+    request: Request,
+    data: GeneratePlanRequest,
+    user: CurrentUser,
+    session: DbSession,
+    redis: RedisClient,
+):
     new_blocks, diff = await schedule_service.generate_new_plan(
         session, user.id, reason=data.reason
     )
-    _preview_cache[user.id] = new_blocks
+    await schedule_service.save_preview(redis, user.id, new_blocks)
     return diff
 
 
 @router.post("/confirm", response_model=dict)
-async def confirm_plan(user: CurrentUser, session: DbSession):
-    new_blocks = _preview_cache.pop(user.id, None)
+async def confirm_plan(user: CurrentUser, session: DbSession, redis: RedisClient):
+    new_blocks = await schedule_service.pop_preview(redis, user.id)
     if new_blocks is None:
         raise HTTPException(status_code=400, detail="No plan preview to confirm")
     version_id = await schedule_service.confirm_plan(session, user.id, new_blocks)
@@ -41,33 +48,22 @@ async def confirm_plan(user: CurrentUser, session: DbSession):
 
 @router.get("/blocks", response_model=list[StudyBlockResponse])
 async def get_blocks(
+    request: Request,
+    response: Response,
     user: CurrentUser,
     session: DbSession,
     start: datetime | None = Query(None),
     end: datetime | None = Query(None),
 ):
-    blocks = await schedule_service.get_current_blocks(session, user.id)
-    titles = await schedule_service.get_task_titles(session, user.id)
-
-    result = []
-    for b in blocks:
-        if start and b.start < start:
-            continue
-        if end and b.end > end:
-            continue
-        result.append(StudyBlockResponse(
-            id=b.id,
-            user_id=b.user_id,
-            task_id=b.task_id,
-            plan_version_id=b.plan_version_id,
-            start=b.start,
-            end=b.end,
-            block_index=b.block_index,
-            is_pinned=b.is_pinned,
-            created_at=b.created_at,
-            task_title=titles.get(b.task_id, ""),
-        ))
-    return result
+    # Blocks carry their task's title and course label, so edits to either
+    # change the tag too
+    etag = await compute_etag(session, request, user.id, StudyBlock, Task, Course)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    rows = await schedule_service.get_blocks_with_labels(session, user.id, start, end)
+    return [_block_response(*row) for row in rows]
 
 
 @router.patch("/blocks/{block_id}", response_model=StudyBlockResponse)
@@ -75,7 +71,16 @@ async def move_block(block_id: int, data: MoveBlockRequest, user: CurrentUser, s
     block = await schedule_service.move_block(session, user.id, block_id, data.start, data.end)
     if not block:
         raise HTTPException(status_code=404, detail="Block not found")
-    titles = await schedule_service.get_task_titles(session, user.id)
+    labels = await schedule_service.get_task_labels(session, block.task_id)
+    return _block_response(block, *labels)
+
+
+def _block_response(
+    block: StudyBlock,
+    task_title: str | None,
+    course_name: str | None,
+    course_color: str | None,
+) -> StudyBlockResponse:
     return StudyBlockResponse(
         id=block.id,
         user_id=block.user_id,
@@ -86,7 +91,9 @@ async def move_block(block_id: int, data: MoveBlockRequest, user: CurrentUser, s
         block_index=block.block_index,
         is_pinned=block.is_pinned,
         created_at=block.created_at,
-        task_title=titles.get(block.task_id, ""),
+        task_title=task_title or "",
+        course_name=course_name or "",
+        course_color=course_color or "",
     )
 
 
@@ -42,7 +42,22 @@ async def list_logs(
     return await time_log_service.list_time_logs(session, user.id, task_id=task_id)
 
 
+def _total(task_id: int, minutes: float) -> dict:
+    return {"task_id": task_id, "total_minutes": round(minutes, 1), "total_hours": round(minutes / 60, 2)}
+
+
 @router.get("/total/{task_id}")
 async def get_total(task_id: int, user: CurrentUser, session: DbSession):
     minutes = await time_log_service.get_total_logged_minutes(session, user.id, task_id)
-    return {"task_id": task_id, "total_minutes": round(minutes, 1), "total_hours": round(minutes / 60, 2)}
+    return _total(task_id, minutes)
+
+
+@router.get("/totals")
+async def get_totals(
+    user: CurrentUser,
+    session: DbSession,
+    task_ids: list[int] = Query(..., max_length=200),
+):
+    """Totals for several tasks at once (``?task_ids=1&task_ids=2``), keyed by task id."""
+    totals = await time_log_service.get_total_minutes_batch(session, user.id, task_ids)
+    return {tid: _total(tid, minutes) for tid, minutes in totals.items()}
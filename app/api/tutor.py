@@ -6,13 +6,61 @@ Socratic tutoring, and multi-level concept explanations.
 
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from celery.result import AsyncResult
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-
-from app.core.deps import CurrentUser, DbSession
+from sqlalchemy import TextClause, text
+from starlette.concurrency import run_in_threadpool
+
+from app.core.deps import CurrentUser, DbSession, RedisClient
+from app.services.tutor.flashcards import generate_flashcards, grade_flashcard
+from app.services.tutor.practice_exams import generate_practice_exam
+from app.services.tutor.routing import MODEL_TIERS
+from app.services.tutor.socratic import (
+    cached_explain_concept,
+    explain_concept_stream,
+    socratic_response,
+    socratic_response_stream,
+)
+from app.tasks.tutor_tasks import run_exam_grading
+from app.tasks.worker import celery_app, is_owned_task_id, owned_task_id
 
 router = APIRouter(prefix="/api/tutor", tags=["tutor"])
 
+_SSE_PREFIX = b"data: "
+_SSE_END = b"\n\n"
+# Stops nginx from buffering the stream until the response completes
+_SSE_HEADERS = {"X-Accel-Buffering": "no"}
+
+
+def _model_override(value: str | None) -> str | None:
+    if value is None:
+        return None
+    if value not in MODEL_TIERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"X-Tutor-Model must be one of: {', '.join(MODEL_TIERS)}",
+        )
+    return value
+
+
+def _json(content: Any) -> Response:
+    # For free-form dicts with no response_model, which FastAPI would otherwise
+    # run through jsonable_encoder + json.dumps
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+def _sse(events) -> StreamingResponse:
+    async def event_generator():
+        async for event in events:
+            yield _SSE_PREFIX + orjson.dumps(event) + _SSE_END
+
+    return StreamingResponse(
+        event_generator(), media_type="text/event-stream", headers=_SSE_HEADERS
+    )
+
 
 # ---- Request / Response schemas ----
 
@@ -56,6 +104,15 @@ class ExamGradeRequest(BaseModel):
     answers: dict[int, str]
 
 
+class GradeJob(BaseModel):
+    job_id: str
+    status: str  # queued | running | completed | failed
+    status_url: str | None = None
+    # Per-question results graded so far, while running
+    partial_results: list[dict[str, Any]] = []
+    result: dict[str, Any] | None = None
+
+
 class SocraticRequest(BaseModel):
     question: str = Field(..., min_length=1)
     context: str | None = None
@@ -93,8 +150,6 @@ async def generate_flashcards_endpoint(
     session: DbSession,
 ):
     """Generate flashcards from study material using Claude."""
-    from app.services.tutor.flashcards import generate_flashcards
-
     cards = await generate_flashcards(
         material_text=data.material_text,
         count=data.count,
@@ -111,40 +166,48 @@ async def generate_flashcards_endpoint(
     return [FlashcardItem(front=c["front"], back=c["back"]) for c in cards]
 
 
+def _flashcard_page_sql(course_filter: str) -> TextClause:
+    # id breaks ties so pages are stable
+    order = "next_review ASC NULLS FIRST, id"
+    page = (
+        "SELECT id, front, back, easiness, interval_days, repetitions,"
+        " next_review, last_reviewed FROM flashcards WHERE user_id = :user_id"
+        f"{course_filter} ORDER BY {order} LIMIT :limit OFFSET :offset"
+    )
+    # Postgres builds the JSON array itself (timestamps come out as ISO 8601),
+    # so the page is returned as-is without materializing rows in Python
+    return text(
+        "SELECT COALESCE(json_agg(json_build_object("
+        "'id', id, 'front', front, 'back', back, 'easiness', easiness,"
+        " 'interval_days', interval_days, 'repetitions', repetitions,"
+        " 'next_review', next_review, 'last_reviewed', last_reviewed)"
+        f" ORDER BY {order}), '[]')::text FROM ({page}) AS page"
+    )
+
+
+# Built once, so every request sends identical SQL (reusable prepared plans)
+_FLASHCARDS_ALL = _flashcard_page_sql("")
+_FLASHCARDS_BY_COURSE = _flashcard_page_sql(" AND course_id = :course_id")
+
+
 @router.get("/flashcards")
 async def list_flashcard_decks(
     user: CurrentUser,
     session: DbSession,
     course_id: int | None = Query(default=None),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=200),
 ):
-    """List flashcard decks for the current user."""
-    from sqlalchemy import text
-
-    query = "SELECT * FROM flashcards WHERE user_id = :user_id"
-    params: dict[str, Any] = {"user_id": user.id}
-
+    """List flashcard decks for the current user, due cards first."""
+    params: dict[str, Any] = {"user_id": user.id, "offset": offset, "limit": limit}
+    query = _FLASHCARDS_ALL
     if course_id:
-        query += " AND course_id = :course_id"
+        query = _FLASHCARDS_BY_COURSE
         params["course_id"] = course_id
 
-    query += " ORDER BY next_review ASC NULLS FIRST"
-
     try:
-        result = await session.execute(text(query), params)
-        rows = result.fetchall()
-        return [
-            {
-                "id": row.id,
-                "front": row.front,
-                "back": row.back,
-                "easiness": row.easiness,
-                "interval_days": row.interval_days,
-                "repetitions": row.repetitions,
-                "next_review": row.next_review.isoformat() if row.next_review else None,
-                "last_reviewed": row.last_reviewed.isoformat() if row.last_reviewed else None,
-            }
-            for row in rows
-        ]
+        result = await session.execute(query, params)
+        return Response(content=result.scalar_one(), media_type="application/json")
     except Exception:
         # Table may not exist yet; return empty
         return []
@@ -158,8 +221,6 @@ async def grade_flashcard_endpoint(
     session: DbSession,
 ):
     """Grade a flashcard review using SM-2 spaced repetition."""
-    from app.services.tutor.flashcards import grade_flashcard
-
     try:
         result = await grade_flashcard(
             card_id=card_id,
@@ -183,8 +244,6 @@ async def generate_exam_endpoint(
     session: DbSession,
 ):
     """Generate a practice exam using Claude."""
-    from app.services.tutor.practice_exams import generate_practice_exam
-
     exam = await generate_practice_exam(
         course_id=data.course_id,
         topics=data.topics,
@@ -200,26 +259,56 @@ async def generate_exam_endpoint(
             detail=exam.get("error", "Failed to generate exam."),
         )
 
-    return exam
+    return _json(exam)
+
+
+_JOB_STATUS = {
+    "SUCCESS": "completed",
+    "FAILURE": "failed",
+    "STARTED": "running",
+    "PROGRESS": "running",
+}
 
 
-@router.post("/exams/{exam_id}/grade")
+@router.post("/exams/{exam_id}/grade", response_model=GradeJob, status_code=202)
 async def grade_exam_endpoint(
     exam_id: int,
     data: ExamGradeRequest,
     user: CurrentUser,
-    session: DbSession,
 ):
-    """Grade a practice exam's answers using Claude."""
-    from app.services.tutor.practice_exams import grade_exam
-
-    result = await grade_exam(
-        exam_id=exam_id,
-        exam_data=data.exam_data,
-        answers=data.answers,
+    """Queue grading of a practice exam's answers; poll the status URL."""
+    job_id = owned_task_id(user.id, exam_id)
+    # Publishing is blocking Redis I/O
+    await run_in_threadpool(
+        run_exam_grading.apply_async,
+        (user.id, exam_id, data.exam_data, data.answers),
+        task_id=job_id,
     )
+    return GradeJob(
+        job_id=job_id,
+        status="queued",
+        status_url=f"/api/tutor/exams/{exam_id}/grade/{job_id}",
+    )
+
 
-    return result
+@router.get("/exams/{exam_id}/grade/{job_id}", response_model=GradeJob)
+async def grade_exam_status_endpoint(exam_id: int, job_id: str, user: CurrentUser):
+    # Checked before any state is returned: queued jobs have no result yet
+    if not is_owned_task_id(job_id, user.id, exam_id):
+        raise HTTPException(status_code=404, detail="Grading job not found")
+
+    def read() -> tuple[str, Any]:
+        job = AsyncResult(job_id, app=celery_app)
+        return job.state, job.info
+
+    # Reading the result backend is blocking Redis I/O
+    state, info = await run_in_threadpool(read)
+    status = _JOB_STATUS.get(state, "queued")
+    if status not in ("completed", "running") or not isinstance(info, dict):
+        return GradeJob(job_id=job_id, status=status)
+    if status == "running":
+        return GradeJob(job_id=job_id, status=status, partial_results=info["results"])
+    return GradeJob(job_id=job_id, status=status, result=info)
 
 
 # ---- Socratic Tutor ----
@@ -230,16 +319,16 @@ async def socratic_question_endpoint(
     data: SocraticRequest,
     user: CurrentUser,
     session: DbSession,
+    tutor_model: str | None = Header(default=None, alias="X-Tutor-Model"),
 ):
     """Ask a Socratic question and receive guided tutoring."""
-    from app.services.tutor.socratic import socratic_response
-
     result = await socratic_response(
         question=data.question,
         context=data.context,
         hint_level=data.hint_level,
         conversation_history=data.conversation_history,
         course_name=data.course_name,
+        model_override=_model_override(tutor_model),
     )
 
     return SocraticResponse(
@@ -249,6 +338,23 @@ async def socratic_question_endpoint(
     )
 
 
+@router.post("/socratic/stream")
+async def socratic_question_stream_endpoint(
+    data: SocraticRequest,
+    user: CurrentUser,
+    tutor_model: str | None = Header(default=None, alias="X-Tutor-Model"),
+):
+    """SSE variant of ``/socratic``: text deltas, then a ``done`` event."""
+    return _sse(socratic_response_stream(
+        question=data.question,
+        context=data.context,
+        hint_level=data.hint_level,
+        conversation_history=data.conversation_history,
+        course_name=data.course_name,
+        model_override=_model_override(tutor_model),
+    ))
+
+
 # ---- Multi-level Explanation ----
 
 
@@ -257,15 +363,17 @@ async def explain_concept_endpoint(
     data: ExplainRequest,
     user: CurrentUser,
     session: DbSession,
+    redis: RedisClient,
+    tutor_model: str | None = Header(default=None, alias="X-Tutor-Model"),
 ):
     """Explain a concept at different levels (ELI5 / undergrad / expert)."""
-    from app.services.tutor.socratic import explain_concept
-
-    result = await explain_concept(
+    result = await cached_explain_concept(
+        redis,
         concept=data.concept,
         level=data.level,
         course_name=data.course_name,
         context=data.context,
+        model_override=_model_override(tutor_model),
     )
 
     return ExplainResponse(
@@ -273,3 +381,19 @@ async def explain_concept_endpoint(
         level=result["level"],
         concept=result["concept"],
     )
+
+
+@router.post("/explain/stream")
+async def explain_concept_stream_endpoint(
+    data: ExplainRequest,
+    user: CurrentUser,
+    tutor_model: str | None = Header(default=None, alias="X-Tutor-Model"),
+):
+    """SSE variant of ``/explain``: text deltas, then a ``done`` event."""
+    return _sse(explain_concept_stream(
+        concept=data.concept,
+        level=data.level,
+        course_name=data.course_name,
+        context=data.context,
+        model_override=_model_override(tutor_model),
+    ))
@@ -0,0 +1,38 @@
+import hashlib
+import logging
+import time
+
+from redis.exceptions import RedisError
+
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a revoked user keeps access via another worker's cache
+AUTH_CACHE_TTL_SECONDS = 60
+
+
+def token_cache_key(token: str) -> str:
+    """Redis key for a bearer token; the token itself is never stored."""
+    return "auth:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+async def get_cached_user_id(key: str) -> int | None:
+    try:
+        value = await get_redis_client().get(key)
+    except RedisError as exc:
+        # The cache is an optimization; fall back to full verification
+        logger.debug("Auth cache read failed: %s", exc)
+        return None
+    return int(value) if value is not None else None
+
+
+async def set_cached_user_id(key: str, user_id: int, exp: float) -> None:
+    """Cache ``user_id`` for the token until its ``exp`` or the TTL, whichever is first."""
+    ttl = int(min(AUTH_CACHE_TTL_SECONDS, exp - time.time()))
+    if ttl <= 0:
+        return
+    try:
+        await get_redis_client().set(key, user_id, ex=ttl)
+    except RedisError as exc:
+        logger.debug("Auth cache write failed: %s", exc)
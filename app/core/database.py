@@ -1,25 +1,72 @@
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 from app.core.config import settings
 
-_connect_args: dict = {"statement_cache_size": 0}
+logger = logging.getLogger(__name__)
+
+_connect_args: dict = {}
+if settings.DATABASE_TRANSACTION_POOLER:
+    # The Supabase pooler runs in transaction mode, which can't hold
+    # server-side prepared statements across transactions. That covers both
+    # asyncpg's cache and SQLAlchemy's own one in front of it, and the
+    # statements each transaction does prepare need names that can't collide
+    # with another client's on the same server connection
+    _connect_args["statement_cache_size"] = 0
+    _connect_args["prepared_statement_cache_size"] = 0
+    _connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+else:
+    # Server-side keepalives stop idle pooled connections from being silently
+    # dropped by NAT/firewalls (poolers reject unknown startup parameters)
+    _connect_args["server_settings"] = {
+        "tcp_keepalives_idle": "30",
+        "tcp_keepalives_interval": "10",
+        "tcp_keepalives_count": "3",
+    }
 if settings.ENVIRONMENT == "production":
     _connect_args["ssl"] = "require"
 
+# Sized for requests that hold a session across slow LLM calls. No pre-ping:
+# it costs a round trip per checkout; dead connections are instead bounded by
+# pool_recycle and retried once by execute_with_retry
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_pre_ping=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_recycle=300,
     connect_args=_connect_args,
 )
 
-async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Writes flush explicitly (or on commit), so reads never pay for an autoflush
+async_session_factory = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+def create_task_engine() -> AsyncEngine:
+    """Unpooled engine for a Celery task's own event loop (asyncio.run).
+
+    The shared pool's connections are bound to the loop that opened them,
+    so each task uses and disposes of its own engine instead.
+    """
+    return create_async_engine(
+        settings.DATABASE_URL, echo=settings.DEBUG, poolclass=NullPool, connect_args=_connect_args
+    )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -27,6 +74,39 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def execute_with_retry(session: AsyncSession, statement, params=None):
+    """Execute a request's first statement, retrying once on a dead connection.
+
+    A stale pooled connection only shows up on its first use. SQLAlchemy then
+    invalidates it (and every older pooled connection), so rolling back and
+    re-executing runs on a fresh one. Only safe before the session has done
+    any work, since the rollback discards it.
+    """
+    try:
+        return await session.execute(statement, params)
+    except DBAPIError as exc:
+        if not exc.connection_invalidated:
+            raise
+        logger.warning("Retrying on a fresh connection after disconnect: %s", exc.orig)
+        await session.rollback()
+        return await session.execute(statement, params)
+
+
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def warm_pool() -> None:
+    """Open pool_size connections up front so the first requests skip the handshake."""
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(engine.pool.size())), return_exceptions=True
+    )
+    failures = [r for r in results if isinstance(r, BaseException)]
+    for conn in results:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    if failures:
+        logger.warning(
+            "Database pool warm-up failed for %d connection(s): %s", len(failures), failures[0]
+        )
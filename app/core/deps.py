@@ -1,22 +1,43 @@
+import secrets
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+import httpx
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from redis.asyncio import Redis
+from sqlalchemy import bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.database import get_session
+from app.core.auth_cache import get_cached_user_id, set_cached_user_id, token_cache_key
+from app.core.config import settings
+from app.core.database import execute_with_retry, get_session
+from app.core.http import get_http_client
+from app.core.redis import get_redis_client
 from app.core.security import verify_supabase_token
 from app.models.user import User
 
 security_scheme = HTTPBearer()
 
+# Built once; runs on every authenticated request
+_user_by_supabase_id = select(User).where(User.supabase_id == bindparam("sub"))
+_user_by_id = select(User).where(User.id == bindparam("user_id"))
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security_scheme)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> User:
-    payload = verify_supabase_token(credentials.credentials)
+    # A token verified by any worker in the last minute skips JWT verification
+    cache_key = token_cache_key(credentials.credentials)
+    user_id = await get_cached_user_id(cache_key)
+    if user_id is not None:
+        result = await execute_with_retry(session, _user_by_id, {"user_id": user_id})
+        user = result.scalar_one_or_none()
+        if user is not None:
+            return user
+
+    payload = await verify_supabase_token(credentials.credentials)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,7 +52,8 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    result = await session.execute(select(User).where(User.supabase_id == sub))
+    # First query of nearly every request, so it absorbs stale-connection retries
+    result = await execute_with_retry(session, _user_by_supabase_id, {"sub": sub})
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(
@@ -39,8 +61,29 @@ async def get_current_user(
             detail="User not found",
         )
 
+    await set_cached_user_id(cache_key, user.id, payload["exp"])
     return user
 
 
+async def require_ops_token(
+    x_ops_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Gate internal endpoints behind OPS_TOKEN; they don't exist without one."""
+    if not settings.OPS_TOKEN or not secrets.compare_digest(
+        (x_ops_token or "").encode(), settings.OPS_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+async def get_redis() -> Redis:
+    return get_redis_client()
+
+
+async def get_http() -> httpx.AsyncClient:
+    return get_http_client()
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 DbSession = Annotated[AsyncSession, Depends(get_session)]
+RedisClient = Annotated[Redis, Depends(get_redis)]
+HttpClient = Annotated[httpx.AsyncClient, Depends(get_http)]
@@ -0,0 +1,35 @@
+import hashlib
+
+from fastapi import Request
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def compute_etag(session: AsyncSession, request: Request, user_id: int, *models) -> str:
+    """Cheap version tag for a user's rows in ``models``.
+
+    Hashes MAX(updated_at) and COUNT(*) per table (one round trip) together
+    with the query string, so any insert, update, or delete — or a different
+    filter/page — yields a new tag without serializing the response.
+    """
+    columns = []
+    for model in models:
+        owned = model.user_id == user_id
+        columns.append(select(func.max(model.updated_at)).where(owned).scalar_subquery())
+        columns.append(select(func.count()).select_from(model).where(owned).scalar_subquery())
+    row = (await session.execute(select(*columns))).one()
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(request.url.query.encode())
+    for value in row:
+        digest.update(f"|{value}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return etag in tags or "*" in tags
@@ -0,0 +1,26 @@
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+# One outbound connection pool per process, created on first use, so
+# repeat calls to the same LMS host reuse kept-alive TLS connections
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # Shared across users: a Set-Cookie from one user's LMS session
+            # must never be replayed on another user's request
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
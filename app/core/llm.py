@@ -0,0 +1,21 @@
+import anthropic
+
+from app.core.config import settings
+
+# One Anthropic client per process, created on first use, so API calls reuse
+# its kept-alive connections instead of a new pool and TLS handshake each time
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    global _client
+    if _client is None:
+        _client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return _client
+
+
+async def close_anthropic_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,20 @@
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# One connection pool per process, created on first use
+_client: Redis | None = None
+
+
+def get_redis_client() -> Redis:
+    global _client
+    if _client is None:
+        _client = Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
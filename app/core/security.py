@@ -1,31 +1,92 @@
-import json
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
-from jose import JWTError, jwk, jwt
+from jose import jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import JOSEError
 
 from app.core.config import settings
+from app.core.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
-# Cache the JWKS keys in-process
-_jwks_cache: dict[str, Any] | None = None
+JWKS_TTL_SECONDS = 600
+# Floor between refetches triggered by unknown kids, so tokens with made-up
+# kids can't turn into one JWKS request each
+JWKS_MIN_REFETCH_SECONDS = 30
+
+# Cache the JWKS in-process as (kid -> (alg, constructed key), fetched_at).
+# Keys are built once per fetch so the verify path never re-parses JWK material.
+_jwks_cache: tuple[dict[str, tuple[str, Key]], float] | None = None
+# The in-flight fetch, shared by every request that needs fresh keys
+_jwks_refresh: asyncio.Task | None = None
+
+# Built once instead of on every verify call
+_DECODE_OPTIONS = {"require_sub": True, "require_exp": True}
+
+# Verified payloads by token digest, so a burst of requests carrying the same
+# token pays for one ECDSA verification. LRU-bounded; entries never outlive
+# the token's own exp.
+VERIFIED_TTL_SECONDS = 60
+_VERIFIED_MAX_ENTRIES = 10_000
+_verified: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
 
 
 def _get_jwks_url() -> str:
     return f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json"
 
 
-def _load_jwks() -> dict[str, list[dict[str, Any]]]:
-    """Fetch JWKS from Supabase discovery endpoint (cached in-process)."""
+def _construct_keys(jwks: dict[str, Any]) -> dict[str, tuple[str, Key]]:
+    keys: dict[str, tuple[str, Key]] = {}
+    for key_data in jwks.get("keys", []):
+        if "kid" not in key_data:
+            continue
+        alg = key_data.get("alg", "ES256")
+        try:
+            keys[key_data["kid"]] = (alg, jwk.construct(key_data, algorithm=alg))
+        except (JOSEError, ValueError, KeyError) as exc:
+            # One unsupported or malformed key must not take the whole set
+            # down (malformed EC/RSA material raises ValueError, not JWKError)
+            logger.warning("Skipping unusable JWK kid=%s: %s", key_data["kid"], exc)
+    return keys
+
+
+async def _fetch_jwks() -> None:
     global _jwks_cache
-    if _jwks_cache is not None:
-        return _jwks_cache
-    resp = httpx.get(_get_jwks_url(), timeout=10)
+    resp = await get_http_client().get(_get_jwks_url(), timeout=10)
     resp.raise_for_status()
-    _jwks_cache = resp.json()
-    return _jwks_cache
+    _jwks_cache = (_construct_keys(resp.json()), time.monotonic())
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("JWKS refresh failed: %s", task.exception())
+
+
+def _refresh_jwks() -> asyncio.Task:
+    """Start a JWKS fetch unless one is already running."""
+    global _jwks_refresh
+    if _jwks_refresh is None or _jwks_refresh.done():
+        _jwks_refresh = asyncio.create_task(_fetch_jwks())
+        _jwks_refresh.add_done_callback(_log_refresh_failure)
+    return _jwks_refresh
+
+
+async def _load_jwks() -> dict[str, tuple[str, Key]]:
+    """Fetch JWKS from Supabase discovery endpoint (cached in-process, keyed by kid)."""
+    if _jwks_cache is None:
+        # Shielded so a cancelled request doesn't cancel the shared fetch
+        await asyncio.shield(_refresh_jwks())
+    keys, fetched_at = _jwks_cache
+    if time.monotonic() - fetched_at > JWKS_TTL_SECONDS:
+        # Serve the stale keys while a background fetch revalidates them
+        _refresh_jwks()
+    return keys
 
 
 def clear_jwks_cache() -> None:
@@ -33,43 +94,56 @@ def clear_jwks_cache() -> None:
     _jwks_cache = None
 
 
-def verify_supabase_token(token: str) -> dict[str, Any] | None:
+def _cached_payload(digest: bytes) -> dict[str, Any] | None:
+    entry = _verified.get(digest)
+    if entry is None:
+        return None
+    payload, expires_at = entry
+    if time.time() >= expires_at:
+        del _verified[digest]
+        return None
+    _verified.move_to_end(digest)
+    return payload
+
+
+def _cache_payload(digest: bytes, payload: dict[str, Any]) -> None:
+    _verified[digest] = (payload, min(time.time() + VERIFIED_TTL_SECONDS, payload["exp"]))
+    if len(_verified) > _VERIFIED_MAX_ENTRIES:
+        _verified.popitem(last=False)
+
+
+async def verify_supabase_token(token: str) -> dict[str, Any] | None:
     """Decode and verify a Supabase-issued JWT using ES256 JWKS."""
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _cached_payload(digest)
+    if payload is not None:
+        return payload
+
     try:
-        # Get the signing key id from the token header
-        header = jwt.get_unverified_header(token)
-        kid = header.get("kid")
-
-        jwks = _load_jwks()
-        signing_key = None
-        for key_data in jwks.get("keys", []):
-            if key_data.get("kid") == kid:
-                signing_key = key_data
-                break
-
-        if signing_key is None:
-            # Key not found — clear cache and retry once
-            clear_jwks_cache()
-            jwks = _load_jwks()
-            for key_data in jwks.get("keys", []):
-                if key_data.get("kid") == kid:
-                    signing_key = key_data
-                    break
-
-        if signing_key is None:
+        kid = jwt.get_unverified_header(token).get("kid")
+
+        entry = (await _load_jwks()).get(kid)
+        if entry is None and time.monotonic() - _jwks_cache[1] > JWKS_MIN_REFETCH_SECONDS:
+            # Key not found — keys may have rotated, refetch once
+            await asyncio.shield(_refresh_jwks())
+            entry = _jwks_cache[0].get(kid)
+
+        if entry is None:
             logger.warning("No matching JWK found for kid=%s", kid)
             return None
 
-        alg = signing_key.get("alg", "ES256")
-        key = jwk.construct(signing_key, algorithm=alg)
-
+        alg, key = entry
         payload = jwt.decode(
             token,
             key,
             algorithms=[alg],
             audience="authenticated",
+            options=_DECODE_OPTIONS,
         )
-        return payload
-    except (JWTError, httpx.HTTPError, KeyError) as exc:
+    except (JOSEError, httpx.HTTPError, KeyError) as exc:
         logger.debug("JWT verification failed: %s", exc)
         return None
+
+    # Only successful verifications are cached
+    _cache_payload(digest, payload)
+    return payload
@@ -11,7 +11,7 @@ from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.middleware import SecurityHeadersMiddleware
-from app.core.rate_limit import limiter
+from app.core.rate_limit import TokenBucketMiddleware, limiter
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +40,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             send_default_pii=False,
         )
 
+    from app.core.database import warm_pool
+
+    await warm_pool()
+
     yield
     # Shutdown
     from app.core.database import engine
+    from app.core.http import close_http_client
+    from app.core.llm import close_anthropic_client
+    from app.core.redis import close_redis
 
     await engine.dispose()
+    await close_redis()
+    await close_http_client()
+    await close_anthropic_client()
 
 
 app = FastAPI(
@@ -56,6 +66,9 @@ app = FastAPI(
     openapi_url="/openapi.json" if settings.DEBUG else None,
 )
 
+# Registered before CORS so rejected calls still carry CORS headers
+app.add_middleware(TokenBucketMiddleware, path="/auth/provision", rate=10 / 60, capacity=10)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.FRONTEND_URL],
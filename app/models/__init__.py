@@ -3,6 +3,7 @@ from app.models.calendar_binding import CalendarBinding
 from app.models.chat import ChatMessage, ChatSession, MessageRole
 from app.models.course import Course
 from app.models.insight import Insight
+from app.models.lms_connection import LMSConnection
 from app.models.material import Material
 from app.models.plan_version import PlanVersion
 from app.models.sharing_rule import SharingRule
@@ -21,6 +22,7 @@ __all__ = [
     "Course",
     "FocusLoad",
     "Insight",
+    "LMSConnection",
     "Material",
     "MessageRole",
     "PlanVersion",
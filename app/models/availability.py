@@ -1,24 +1,29 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, LargeBinary, Text
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import updated_at_field
+
 
 class AvailabilityGrid(SQLModel, table=True):
     __tablename__ = "availability_grids"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", unique=True, index=True)
 
-    # JSON: 7 days × 96 slots (15-min each) = boolean grid
-    # Format: {"monday": [true, true, false, ...], "tuesday": [...], ...}
-    grid: str = Field(sa_column=Column(Text, default="{}"))
+    # 7 days × 96 slots (15-min each), one bit per slot (1 = available):
+    # 12 little-endian bytes per day, Monday first, bit i = slot i.
+    # See app.services.availability_cache.pack_grid / unpack_grid
+    grid_bits: bytes = Field(sa_column=Column(LargeBinary, nullable=False, default=bytes(84)))
 
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    updated_at: datetime = updated_at_field()
 
 
 class SchedulingRules(SQLModel, table=True):
     __tablename__ = "scheduling_rules"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", unique=True, index=True)
@@ -39,4 +44,7 @@ class SchedulingRules(SQLModel, table=True):
     lighter_weekends: bool = True
     weekend_max_hours: float = 4.0
 
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    # JSON: EnergyProfile; NULL means the balanced preset
+    energy_profile_json: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+
+    updated_at: datetime = updated_at_field()
@@ -2,9 +2,12 @@ from datetime import datetime
 
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class CalendarBinding(SQLModel, table=True):
     __tablename__ = "calendar_bindings"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -15,4 +18,4 @@ class CalendarBinding(SQLModel, table=True):
     last_synced_hash: str = ""
     last_synced_at: datetime | None = None
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
@@ -1,9 +1,12 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Enum, Text
+from sqlalchemy import JSON, Column, Enum, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field, updated_at_field
+
 
 class MessageRole(str, enum.Enum):
     USER = "user"
@@ -13,18 +16,20 @@ class MessageRole(str, enum.Enum):
 
 class ChatSession(SQLModel, table=True):
     __tablename__ = "chat_sessions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     title: str = "New Chat"
     is_active: bool = True
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
 
 
 class ChatMessage(SQLModel, table=True):
     __tablename__ = "chat_messages"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     session_id: int = Field(foreign_key="chat_sessions.id", index=True)
@@ -32,6 +37,9 @@ class ChatMessage(SQLModel, table=True):
 
     role: str = Field(sa_column=Column(Enum(MessageRole), default=MessageRole.USER))
     content: str = Field(sa_column=Column(Text, default=""))
-    tool_calls: str = Field(sa_column=Column(Text, default=""))  # JSON
+    # JSON: [{"name": ..., "arguments": {...}}]; JSONB on Postgres
+    tool_calls: list[dict] | None = Field(
+        default=None, sa_column=Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+    )
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
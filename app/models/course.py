@@ -2,9 +2,12 @@ from datetime import datetime, date
 
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field, updated_at_field
+
 
 class Course(SQLModel, table=True):
     __tablename__ = "courses"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -15,5 +18,5 @@ class Course(SQLModel, table=True):
     term_end: date | None = None
     estimation_multiplier: float = 1.0
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
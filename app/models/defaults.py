@@ -0,0 +1,41 @@
+from typing import Any
+
+from sqlalchemy import Column, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlmodel import Field
+
+
+class UtcNow(FunctionElement):
+    """Current UTC time as a naive timestamp, computed by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    # clock_timestamp() rather than now(): rows inserted in one transaction
+    # (e.g. a chat turn's user and assistant messages) keep distinct times
+    return "TIMEZONE('utc', clock_timestamp())"
+
+
+@compiles(UtcNow)
+def _utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+def created_at_field() -> Any:
+    """Insert timestamp filled in by the database (fetched back via RETURNING)."""
+    return Field(sa_column=Column(DateTime, nullable=False, server_default=UtcNow()))
+
+
+def updated_at_field() -> Any:
+    """Like ``created_at_field`` but also bumped by the database on every UPDATE.
+
+    Models using it need ``eager_defaults`` so the new value is returned by the
+    UPDATE instead of being lazy-loaded later (which async sessions can't do).
+    """
+    return Field(
+        sa_column=Column(DateTime, nullable=False, server_default=UtcNow(), onupdate=UtcNow())
+    )
@@ -0,0 +1,33 @@
+import functools
+import json
+from typing import Any
+
+from cryptography.fernet import Fernet
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+from app.core.config import settings
+
+
+@functools.cache
+def _fernet() -> Fernet:
+    if not settings.CREDENTIALS_ENCRYPTION_KEY:
+        raise RuntimeError("CREDENTIALS_ENCRYPTION_KEY is not set")
+    return Fernet(settings.CREDENTIALS_ENCRYPTION_KEY)
+
+
+class EncryptedJSON(TypeDecorator):
+    """JSON value stored as a Fernet token, for third-party secrets at rest."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> str | None:
+        if value is None:
+            return None
+        return _fernet().encrypt(json.dumps(value).encode()).decode()
+
+    def process_result_value(self, value: str | None, dialect) -> Any:
+        if value is None:
+            return None
+        return json.loads(_fernet().decrypt(value.encode()))
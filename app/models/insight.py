@@ -2,9 +2,12 @@ from datetime import datetime, date
 
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class Insight(SQLModel, table=True):
     __tablename__ = "insights"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -15,4 +18,4 @@ class Insight(SQLModel, table=True):
     actual_hours: float = 0
     risk_score: float = 0  # 0-1, higher = more at risk
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
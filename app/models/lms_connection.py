@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Index
+from sqlmodel import Field, SQLModel
+
+from app.models.defaults import created_at_field, updated_at_field
+from app.models.encrypted import EncryptedJSON
+
+
+class LMSConnection(SQLModel, table=True):
+    __tablename__ = "lms_connections"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("uq_lms_connections_user_provider", "user_id", "provider", unique=True),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id")
+    provider: str  # canvas | moodle
+
+    # Provider-specific connector credentials, e.g. {"base_url": ..., "api_token": ...};
+    # encrypted at rest since the tokens are long-lived
+    credentials: dict = Field(
+        default_factory=dict, sa_column=Column(EncryptedJSON(), nullable=False)
+    )
+
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
@@ -1,9 +1,12 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Enum
+from sqlalchemy import Column, Enum, Text
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class ExtractionStatus(str, enum.Enum):
     PENDING = "pending"
@@ -12,8 +15,17 @@ class ExtractionStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+# Can run to megabytes of text. Deferred so list queries don't pull it;
+# readers that need it opt in with .options(undefer(Material.extracted_text))
+_extracted_text = Column("extracted_text", Text, nullable=False, default="")
+
+
 class Material(SQLModel, table=True):
     __tablename__ = "materials"
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "properties": {"extracted_text": deferred(_extracted_text, raiseload=True)},
+    }
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -27,6 +39,6 @@ class Material(SQLModel, table=True):
     extraction_status: str = Field(
         sa_column=Column(Enum(ExtractionStatus), default=ExtractionStatus.PENDING)
     )
-    extracted_text: str = ""
+    extracted_text: str = Field(default="", sa_column=_extracted_text)
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
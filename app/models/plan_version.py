@@ -1,17 +1,28 @@
 from datetime import datetime
 
 from sqlalchemy import Column, Text
+from sqlalchemy.orm import deferred
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
+# JSON snapshot of all blocks; only a rollback reads it, so it stays
+# deferred and version listings don't pull it
+_snapshot = Column("snapshot", Text, default="")
+
 
 class PlanVersion(SQLModel, table=True):
     __tablename__ = "plan_versions"
+    __mapper_args__ = {
+        "eager_defaults": True,
+        "properties": {"snapshot": deferred(_snapshot, raiseload=True)},
+    }
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     version_number: int
     trigger: str = ""  # e.g., "manual_replan", "drag_move", "chat_action", "new_task"
-    snapshot: str = Field(sa_column=Column(Text, default=""))  # JSON snapshot of all blocks
+    snapshot: str = Field(sa_column=_snapshot)
     diff_summary: str = ""  # Human-readable summary
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
@@ -1,9 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Enum
+from sqlalchemy import Column, Enum, Index
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class Visibility(str, enum.Enum):
     BUSY_ONLY = "busy_only"
@@ -13,6 +15,13 @@ class Visibility(str, enum.Enum):
 
 class SharingRule(SQLModel, table=True):
     __tablename__ = "sharing_rules"
+    __mapper_args__ = {"eager_defaults": True}
+    # "Shared with me" matches active rules by user id OR by email; one index
+    # per branch lets Postgres combine them with a bitmap OR
+    __table_args__ = (
+        Index("ix_sharing_rules_active_shared_with_id", "is_active", "shared_with_id"),
+        Index("ix_sharing_rules_active_shared_with_email", "is_active", "shared_with_email"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     owner_id: int = Field(foreign_key="users.id", index=True)
@@ -23,4 +32,4 @@ class SharingRule(SQLModel, table=True):
     tag_filter: str | None = None  # JSON list of tag IDs to share
     is_active: bool = True
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
@@ -1,13 +1,20 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field, updated_at_field
+
 
 class StudyBlock(SQLModel, table=True):
     __tablename__ = "study_blocks"
+    __mapper_args__ = {"eager_defaults": True}
+    # Schedule reads are "this user's blocks in a date range, by start";
+    # the composite also covers plain user_id lookups
+    __table_args__ = (Index("ix_study_blocks_user_start", "user_id", "start"),)
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     task_id: int = Field(foreign_key="tasks.id", index=True)
     plan_version_id: int | None = Field(default=None, foreign_key="plan_versions.id", index=True)
 
@@ -16,5 +23,5 @@ class StudyBlock(SQLModel, table=True):
     block_index: int = 0
     is_pinned: bool = False
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
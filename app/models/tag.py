@@ -1,21 +1,28 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class Tag(SQLModel, table=True):
     __tablename__ = "tags"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     name: str
     color: str = "#6B7280"
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
 
 
 class TaskTag(SQLModel, table=True):
     __tablename__ = "task_tags"
+    # The primary key leads with task_id; this serves "tasks with tag X"
+    # (and the FK check when a tag is deleted) as an index-only scan
+    __table_args__ = (Index("ix_task_tags_tag_task", "tag_id", "task_id"),)
 
     task_id: int = Field(foreign_key="tasks.id", primary_key=True)
     tag_id: int = Field(foreign_key="tags.id", primary_key=True)
@@ -1,9 +1,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Enum
+from sqlalchemy import Column, Enum, Index
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field, updated_at_field
+
 
 class TaskStatus(str, enum.Enum):
     ACTIVE = "active"
@@ -34,9 +36,17 @@ class FocusLoad(str, enum.Enum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __mapper_args__ = {"eager_defaults": True}
+    # Task lists are always per user, ordered by due date and usually
+    # filtered to one status; both composites lead with user_id, so they
+    # also serve plain user_id lookups
+    __table_args__ = (
+        Index("ix_tasks_user_due", "user_id", "due_date"),
+        Index("ix_tasks_user_status_due", "user_id", "status", "due_date"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     course_id: int | None = Field(default=None, foreign_key="courses.id", index=True)
 
     title: str
@@ -55,5 +65,5 @@ class Task(SQLModel, table=True):
     max_block_minutes: int = 120
 
     completed_at: datetime | None = None
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
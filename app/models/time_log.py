@@ -4,6 +4,8 @@ from datetime import datetime
 from sqlalchemy import Column, Enum
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field
+
 
 class LogType(str, enum.Enum):
     TIMER = "timer"
@@ -12,6 +14,7 @@ class LogType(str, enum.Enum):
 
 class TimeLog(SQLModel, table=True):
     __tablename__ = "time_logs"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -23,4 +26,4 @@ class TimeLog(SQLModel, table=True):
     end: datetime | None = None
     duration_minutes: float = 0
 
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
@@ -2,9 +2,12 @@ from datetime import datetime
 
 from sqlmodel import Field, SQLModel
 
+from app.models.defaults import created_at_field, updated_at_field
+
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True)
@@ -19,5 +22,5 @@ class User(SQLModel, table=True):
     study_calendar_id: str | None = None
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
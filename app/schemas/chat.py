@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class ChatRequest(BaseModel):
@@ -22,6 +22,12 @@ class ChatMessageResponse(BaseModel):
     tool_calls: list[ToolCallInfo] = []
     created_at: datetime
 
+    @field_validator("tool_calls", mode="before")
+    @classmethod
+    def null_as_empty(cls, v: object) -> object:
+        # chat_messages.tool_calls is NULL when the reply used no tools
+        return [] if v is None else v
+
 
 class ChatSessionResponse(BaseModel):
     id: int
@@ -0,0 +1,142 @@
+"""Availability as slot bitmasks: the stored grid format and an in-process cache.
+
+Grids are stored as one bit per 15-minute slot (bit i = slot i is free).
+The cache holds one int per weekday with the user's sleep window already
+masked out, so free-time intersection needs no query on a hit. Writes
+through availability_service invalidate the local entry; other workers pick
+changes up within the TTL.
+"""
+
+import time
+from collections import OrderedDict
+from itertools import compress
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models.availability import AvailabilityGrid, SchedulingRules
+from app.models.user import User
+from app.schemas.availability import AvailabilityGridSchema, SchedulingRulesSchema
+
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+SLOTS_PER_DAY = 96  # 24 hours * 4 quarters
+SLOT_MINUTES = 15
+ALL_SLOTS = (1 << SLOTS_PER_DAY) - 1
+DAY_BYTES = SLOTS_PER_DAY // 8
+
+AVAILABILITY_TTL_SECONDS = 60
+_MAX_ENTRIES = 10_000
+
+_SLOTS_PER_HOUR = 60 // SLOT_MINUTES
+_SLOT_BITS = [1 << slot_idx for slot_idx in range(SLOTS_PER_DAY)]
+
+_EMPTY_GRID = bytes(DAY_BYTES * len(DAY_NAMES))
+_DEFAULT_SLEEP = (
+    SchedulingRulesSchema().sleep_start_hour,
+    SchedulingRulesSchema().sleep_end_hour,
+)
+
+# user_id -> (mask per weekday, expires_at monotonic)
+_cache: OrderedDict[int, tuple[tuple[int, ...], float]] = OrderedDict()
+
+
+def _slots_to_mask(slots: list[bool]) -> int:
+    """Pack a day's slots into an int; slots past the end of the list count as busy."""
+    # Bits are distinct, so summing the selected ones is the same as OR-ing them
+    return sum(compress(_SLOT_BITS, slots))
+
+
+def pack_grid(grid: AvailabilityGridSchema) -> bytes:
+    """Storage form of a grid: DAY_BYTES little-endian bytes per day in DAY_NAMES order."""
+    return b"".join(
+        _slots_to_mask(getattr(grid, day)).to_bytes(DAY_BYTES, "little")
+        for day in DAY_NAMES
+    )
+
+
+def grid_day_masks(grid_bits: bytes) -> tuple[int, ...]:
+    """Per-day slot masks straight from the stored bytes (no Pydantic involved)."""
+    return tuple(
+        int.from_bytes(grid_bits[i * DAY_BYTES:(i + 1) * DAY_BYTES], "little")
+        for i in range(len(DAY_NAMES))
+    )
+
+
+def unpack_grid(grid_bits: bytes) -> AvailabilityGridSchema:
+    days = {}
+    for day, mask in zip(DAY_NAMES, grid_day_masks(grid_bits)):
+        # Binary string is most-significant first; reverse so index = slot
+        days[day] = [c == "1" for c in reversed(format(mask, f"0{SLOTS_PER_DAY}b"))]
+    return AvailabilityGridSchema(**days)
+
+
+def _awake_mask(sleep_start_hour: int, sleep_end_hour: int) -> int:
+    """Bits set for every slot outside the user's sleep window."""
+
+    def hours(start: int, end: int) -> int:
+        return ((1 << ((end - start) * _SLOTS_PER_HOUR)) - 1) << (start * _SLOTS_PER_HOUR)
+
+    if sleep_start_hour > sleep_end_hour:
+        # Wraps midnight, e.g. sleep 23-7
+        asleep = hours(sleep_start_hour, 24) | hours(0, sleep_end_hour)
+    elif sleep_start_hour < sleep_end_hour:
+        asleep = hours(sleep_start_hour, sleep_end_hour)
+    else:
+        asleep = 0
+    return ALL_SLOTS & ~asleep
+
+
+def week_masks(grid_bits: bytes, sleep_start_hour: int, sleep_end_hour: int) -> tuple[int, ...]:
+    """Free-and-awake slot mask for each day in DAY_NAMES."""
+    awake = _awake_mask(sleep_start_hour, sleep_end_hour)
+    return tuple(mask & awake for mask in grid_day_masks(grid_bits))
+
+
+async def get_week_masks(session: AsyncSession, user_ids: list[int]) -> list[tuple[int, ...]]:
+    """Week masks for each user in ``user_ids`` (same order).
+
+    Cache misses are loaded together in one round trip: users outer-joined
+    to their grid and rules, so users without either get the defaults.
+    """
+    now = time.monotonic()
+    found: dict[int, tuple[int, ...]] = {}
+    for user_id in user_ids:
+        entry = _cache.get(user_id)
+        if entry is not None and now < entry[1]:
+            _cache.move_to_end(user_id)
+            found[user_id] = entry[0]
+
+    missing = [user_id for user_id in user_ids if user_id not in found]
+    if missing:
+        rows = await session.execute(
+            select(
+                User.id,
+                AvailabilityGrid.grid_bits,
+                SchedulingRules.sleep_start_hour,
+                SchedulingRules.sleep_end_hour,
+            )
+            .outerjoin(AvailabilityGrid, AvailabilityGrid.user_id == User.id)
+            .outerjoin(SchedulingRules, SchedulingRules.user_id == User.id)
+            .where(User.id.in_(missing))
+        )
+        expires_at = now + AVAILABILITY_TTL_SECONDS
+        for user_id, grid_bits, sleep_start, sleep_end in rows:
+            if sleep_start is None:
+                sleep_start, sleep_end = _DEFAULT_SLEEP
+            found[user_id] = week_masks(grid_bits or _EMPTY_GRID, sleep_start, sleep_end)
+            _cache[user_id] = (found[user_id], expires_at)
+            _cache.move_to_end(user_id)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    # Unknown user ids have no availability at all
+    no_slots = (0,) * len(DAY_NAMES)
+    return [found.get(user_id, no_slots) for user_id in user_ids]
+
+
+def invalidate_availability(user_id: int) -> None:
+    _cache.pop(user_id, None)
+
+
+def clear_availability_cache() -> None:
+    _cache.clear()
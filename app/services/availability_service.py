@@ -1,10 +1,9 @@
-import json
-
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.models.availability import AvailabilityGrid, SchedulingRules
 from app.schemas.availability import AvailabilityGridSchema, SchedulingRulesSchema
+from app.services.availability_cache import invalidate_availability, pack_grid, unpack_grid
 
 
 async def get_availability_grid(session: AsyncSession, user_id: int) -> AvailabilityGridSchema:
@@ -14,7 +13,7 @@ async def get_availability_grid(session: AsyncSession, user_id: int) -> Availabi
     grid = result.scalar_one_or_none()
     if not grid:
         return AvailabilityGridSchema()
-    return AvailabilityGridSchema(**json.loads(grid.grid))
+    return unpack_grid(grid.grid_bits)
 
 
 async def update_availability_grid(
@@ -24,15 +23,16 @@ async def update_availability_grid(
         select(AvailabilityGrid).where(AvailabilityGrid.user_id == user_id)
     )
     grid = result.scalar_one_or_none()
-    grid_json = json.dumps(data.model_dump())
+    grid_bits = pack_grid(data)
 
     if grid:
-        grid.grid = grid_json
+        grid.grid_bits = grid_bits
     else:
-        grid = AvailabilityGrid(user_id=user_id, grid=grid_json)
+        grid = AvailabilityGrid(user_id=user_id, grid_bits=grid_bits)
         session.add(grid)
 
     await session.commit()
+    invalidate_availability(user_id)
     return data
 
 
@@ -74,4 +74,5 @@ async def update_scheduling_rules(
         session.add(rules)
 
     await session.commit()
+    invalidate_availability(user_id)
     return data
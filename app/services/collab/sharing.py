@@ -12,9 +12,11 @@ from datetime import datetime
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.models.course import Course
 from app.models.sharing_rule import SharingRule, Visibility
 from app.models.study_block import StudyBlock
 from app.models.task import Task
@@ -83,7 +85,6 @@ async def create_sharing_rule(
         visibility=data.visibility,
         tag_filter=json.dumps(data.tag_filter) if data.tag_filter else None,
         is_active=True,
-        created_at=datetime.utcnow(),
     )
     session.add(rule)
     await session.commit()
@@ -108,8 +109,7 @@ async def list_shared_with_me(
 ) -> list[SharingRule]:
     """List all rules where someone has shared their schedule with this user."""
     # Match by user id or by email
-    user_result = await session.execute(select(User).where(User.id == user_id))
-    user = user_result.scalar_one_or_none()
+    user = await session.get(User, user_id)
     if not user:
         return []
 
@@ -130,15 +130,13 @@ async def delete_sharing_rule(
 ) -> bool:
     """Delete (deactivate) a sharing rule. Only the owner may do this."""
     result = await session.execute(
-        select(SharingRule).where(
-            SharingRule.id == rule_id, SharingRule.owner_id == owner_id
-        )
+        update(SharingRule)
+        .where(SharingRule.id == rule_id, SharingRule.owner_id == owner_id)
+        .values(is_active=False)
     )
-    rule = result.scalar_one_or_none()
-    if not rule:
+    if not result.rowcount:
         return False
 
-    rule.is_active = False
     await session.commit()
     return True
 
@@ -146,7 +144,7 @@ async def delete_sharing_rule(
 async def get_shared_schedule(
     session: AsyncSession,
     rule_id: int,
-    viewer_id: int,
+    viewer: User,
 ) -> list[SharedBlockResponse]:
     """
     Get the schedule shared via a specific rule.
@@ -164,68 +162,38 @@ async def get_shared_schedule(
     if not rule:
         raise HTTPException(status_code=404, detail="Sharing rule not found")
 
-    # Check the viewer matches
-    viewer_result = await session.execute(select(User).where(User.id == viewer_id))
-    viewer = viewer_result.scalar_one_or_none()
-    if not viewer:
-        raise HTTPException(status_code=404, detail="Viewer not found")
-
     is_authorised = (
-        rule.shared_with_id == viewer_id
+        rule.shared_with_id == viewer.id
         or rule.shared_with_email == viewer.email
     )
     if not is_authorised:
         raise HTTPException(status_code=403, detail="Not authorised to view this schedule")
 
-    # Load blocks for the schedule owner
-    owner_id = rule.owner_id
-    blocks_result = await session.execute(
-        select(StudyBlock)
-        .where(StudyBlock.user_id == owner_id)
+    # Owner's blocks with their task and course details in one joined query.
+    # Tag filters (rule.tag_filter) aren't applied yet; every block is shared.
+    rows = await session.execute(
+        select(StudyBlock.start, StudyBlock.end, Task.title, Task.description, Course.name)
+        .outerjoin(Task, Task.id == StudyBlock.task_id)
+        .outerjoin(Course, Course.id == Task.course_id)
+        .where(StudyBlock.user_id == rule.owner_id)
         .order_by(StudyBlock.start)
     )
-    blocks = list(blocks_result.scalars().all())
-
-    # If there is a tag filter, we need to filter blocks by task tags
-    tag_filter: list[int] | None = None
-    if rule.tag_filter:
-        try:
-            tag_filter = json.loads(rule.tag_filter)
-        except Exception:
-            tag_filter = None
-
-    # Pre-load tasks for enrichment
-    task_ids = {b.task_id for b in blocks}
-    tasks_by_id: dict[int, Task] = {}
-    if task_ids:
-        tasks_result = await session.execute(
-            select(Task).where(Task.id.in_(task_ids))  # type: ignore[attr-defined]
-        )
-        for t in tasks_result.scalars().all():
-            tasks_by_id[t.id] = t
 
     # Build responses according to visibility level
     visibility = rule.visibility
+    show_details = visibility in (Visibility.DETAILS, Visibility.FULL)
+    show_full = visibility == Visibility.FULL
     responses: list[SharedBlockResponse] = []
 
-    for block in blocks:
-        task = tasks_by_id.get(block.task_id)
-
-        # Apply tag filter if set (skip blocks whose task doesn't match)
-        if tag_filter and task:
-            # Tag filtering would require a join with TaskTag — for now
-            # we include all blocks.  A future enhancement can filter here.
-            pass
-
-        item = SharedBlockResponse(start=block.start, end=block.end)
+    for start, end, title, description, course_name in rows:
+        item = SharedBlockResponse(start=start, end=end)
 
-        if visibility in (Visibility.DETAILS.value, Visibility.FULL.value, "details", "full"):
-            item.task_title = task.title if task else None
-            # Course name would require another join; left as None for now.
-            item.course_name = None
+        if show_details:
+            item.task_title = title
+            item.course_name = course_name
 
-        if visibility in (Visibility.FULL.value, "full"):
-            item.task_description = task.description if task else None
+        if show_full:
+            item.task_description = description
 
         responses.append(item)
 
@@ -11,9 +11,11 @@ from datetime import datetime
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import Index, delete, exists, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Field, SQLModel, select
 
+from app.models.defaults import created_at_field, updated_at_field
 from app.models.user import User
 from app.services.collab.free_time import FreeSlot, find_mutual_free_slots
 
@@ -23,22 +25,29 @@ from app.services.collab.free_time import FreeSlot, find_mutual_free_slots
 
 class StudyGroup(SQLModel, table=True):
     __tablename__ = "study_groups"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Field(default=None, primary_key=True)
     name: str
     description: str = ""
     owner_id: int = Field(foreign_key="users.id", index=True)
-    created_at: datetime = Field(default_factory=lambda: datetime.utcnow())
-    updated_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = created_at_field()
+    updated_at: datetime = updated_at_field()
 
 
 class StudyGroupMember(SQLModel, table=True):
     __tablename__ = "study_group_members"
+    __mapper_args__ = {"eager_defaults": True}
+    # Membership checks probe (group_id, user_id); the index also keeps a user
+    # from joining twice and covers group_id-only lookups
+    __table_args__ = (
+        Index("uq_study_group_members_group_user", "group_id", "user_id", unique=True),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    group_id: int = Field(foreign_key="study_groups.id", index=True)
+    group_id: int = Field(foreign_key="study_groups.id")
     user_id: int = Field(foreign_key="users.id", index=True)
-    joined_at: datetime = Field(default_factory=lambda: datetime.utcnow())
+    joined_at: datetime = created_at_field()
 
 
 # ── Request / response schemas ───────────────────────────────────────
@@ -97,29 +106,34 @@ async def create_group(
     return group
 
 
+async def _is_member(session: AsyncSession, group_id: int, user_id: int) -> bool:
+    return await session.scalar(
+        select(
+            exists().where(
+                StudyGroupMember.group_id == group_id,
+                StudyGroupMember.user_id == user_id,
+            )
+        )
+    )
+
+
 async def add_member(
     session: AsyncSession,
     group_id: int,
     requester_id: int,
     data: MemberAdd,
-) -> StudyGroupMember:
-    """Add a member to a study group by email. Only group owner or existing member can add."""
+) -> tuple[StudyGroupMember, User]:
+    """
+    Add a member to a study group by email. Only group owner or existing member can add.
+
+    Returns the new membership together with the added user.
+    """
     # Verify the group exists
-    group_result = await session.execute(
-        select(StudyGroup).where(StudyGroup.id == group_id)
-    )
-    group = group_result.scalar_one_or_none()
-    if not group:
+    if not await session.scalar(select(exists().where(StudyGroup.id == group_id))):
         raise HTTPException(status_code=404, detail="Group not found")
 
     # Verify the requester is a member of the group
-    member_check = await session.execute(
-        select(StudyGroupMember).where(
-            StudyGroupMember.group_id == group_id,
-            StudyGroupMember.user_id == requester_id,
-        )
-    )
-    if member_check.scalar_one_or_none() is None:
+    if not await _is_member(session, group_id, requester_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only group members can add new members",
@@ -134,13 +148,7 @@ async def add_member(
         raise HTTPException(status_code=404, detail="User not found")
 
     # Check if already a member
-    existing = await session.execute(
-        select(StudyGroupMember).where(
-            StudyGroupMember.group_id == group_id,
-            StudyGroupMember.user_id == target_user.id,
-        )
-    )
-    if existing.scalar_one_or_none() is not None:
+    if await _is_member(session, group_id, target_user.id):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User is already a member of this group",
@@ -149,8 +157,7 @@ async def add_member(
     member = StudyGroupMember(group_id=group_id, user_id=target_user.id)
     session.add(member)
     await session.commit()
-    await session.refresh(member)
-    return member
+    return member, target_user
 
 
 async def remove_member(
@@ -185,17 +192,15 @@ async def remove_member(
             detail="Cannot remove the group owner. Delete the group instead.",
         )
 
-    member_result = await session.execute(
-        select(StudyGroupMember).where(
+    result = await session.execute(
+        delete(StudyGroupMember).where(
             StudyGroupMember.group_id == group_id,
             StudyGroupMember.user_id == target_user_id,
         )
     )
-    member = member_result.scalar_one_or_none()
-    if not member:
+    if not result.rowcount:
         return False
 
-    await session.delete(member)
     await session.commit()
     return True
 
@@ -205,42 +210,28 @@ async def list_groups(
     user_id: int,
 ) -> list[GroupResponse]:
     """List all groups the user belongs to."""
-    # Find group IDs the user is a member of
-    membership_result = await session.execute(
-        select(StudyGroupMember.group_id).where(
-            StudyGroupMember.user_id == user_id
-        )
-    )
-    group_ids = [row[0] for row in membership_result.all()]
-
-    if not group_ids:
-        return []
-
-    # Load groups
-    groups_result = await session.execute(
-        select(StudyGroup).where(StudyGroup.id.in_(group_ids))  # type: ignore[attr-defined]
+    # Groups and their member counts in one grouped query; the membership
+    # subquery picks the groups, the join counts everyone in them
+    my_groups = select(StudyGroupMember.group_id).where(StudyGroupMember.user_id == user_id)
+    result = await session.execute(
+        select(StudyGroup, func.count(StudyGroupMember.id))
+        .join(StudyGroupMember, StudyGroupMember.group_id == StudyGroup.id)
+        .where(StudyGroup.id.in_(my_groups))  # type: ignore[attr-defined]
+        .group_by(StudyGroup.id)
+        .order_by(StudyGroup.id)
     )
-    groups = list(groups_result.scalars().all())
 
-    # Count members per group
-    responses: list[GroupResponse] = []
-    for g in groups:
-        count_result = await session.execute(
-            select(StudyGroupMember).where(StudyGroupMember.group_id == g.id)
+    return [
+        GroupResponse(
+            id=g.id,
+            name=g.name,
+            description=g.description,
+            owner_id=g.owner_id,
+            member_count=member_count,
+            created_at=g.created_at,
         )
-        member_count = len(list(count_result.scalars().all()))
-        responses.append(
-            GroupResponse(
-                id=g.id,
-                name=g.name,
-                description=g.description,
-                owner_id=g.owner_id,
-                member_count=member_count,
-                created_at=g.created_at,
-            )
-        )
-
-    return responses
+        for g, member_count in result.all()
+    ]
 
 
 async def find_mutual_free_time(
@@ -253,26 +244,18 @@ async def find_mutual_free_time(
 
     Returns overlapping availability slots that work for everyone.
     """
-    # Verify the requester is a member
-    member_check = await session.execute(
-        select(StudyGroupMember).where(
-            StudyGroupMember.group_id == group_id,
-            StudyGroupMember.user_id == requester_id,
-        )
-    )
-    if member_check.scalar_one_or_none() is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only group members can view mutual free time",
-        )
-
-    # Get all member user IDs
+    # The member list doubles as the membership check
     members_result = await session.execute(
         select(StudyGroupMember.user_id).where(
             StudyGroupMember.group_id == group_id
         )
     )
     user_ids = [row[0] for row in members_result.all()]
+    if requester_id not in user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only group members can view mutual free time",
+        )
 
     if len(user_ids) < 2:
         return []
@@ -1,5 +1,4 @@
-from datetime import datetime
-
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -37,16 +36,16 @@ async def update_course(
         return None
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(course, key, value)
-    course.updated_at = datetime.utcnow()
     await session.commit()
     await session.refresh(course)
     return course
 
 
 async def delete_course(session: AsyncSession, user_id: int, course_id: int) -> bool:
-    course = await get_course(session, user_id, course_id)
-    if not course:
+    result = await session.execute(
+        delete(Course).where(Course.id == course_id, Course.user_id == user_id)
+    )
+    if not result.rowcount:
         return False
-    await session.delete(course)
     await session.commit()
     return True
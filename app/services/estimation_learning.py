@@ -3,6 +3,7 @@ Estimation learning: track actual vs estimated hours per course+type.
 Updates multipliers so future estimates improve over time.
 """
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -11,6 +12,35 @@ from app.models.task import Task, TaskStatus
 from app.models.time_log import TimeLog
 
 
+def _task_ratios(user_id: int):
+    """actual_hours / estimated_hours per completed task, one row per task.
+
+    Logged minutes are summed in the same grouped query; tasks without any
+    logged time drop out of the inner join.
+    """
+    actual_minutes = func.sum(TimeLog.duration_minutes)
+    return (
+        select(
+            Task.course_id,
+            Task.task_type,
+            (actual_minutes / 60.0 / Task.estimated_hours).label("ratio"),
+        )
+        .join(TimeLog, (TimeLog.task_id == Task.id) & (TimeLog.user_id == user_id))
+        .where(
+            Task.user_id == user_id,
+            Task.status == TaskStatus.COMPLETED,
+            Task.estimated_hours.is_not(None),
+            Task.estimated_hours > 0,
+        )
+        .group_by(Task.id, Task.course_id, Task.task_type, Task.estimated_hours)
+        .having(actual_minutes > 0)
+    )
+
+
+def _clamp(multiplier: float) -> float:
+    return max(0.5, min(3.0, multiplier))
+
+
 async def compute_multiplier(
     session: AsyncSession,
     user_id: int,
@@ -22,45 +52,18 @@ async def compute_multiplier(
     Returns (multiplier, sample_count).
     multiplier = avg(actual_hours / estimated_hours)
     """
-    query = (
-        select(Task)
-        .where(
-            Task.user_id == user_id,
-            Task.status == TaskStatus.COMPLETED,
-            Task.estimated_hours.is_not(None),
-            Task.estimated_hours > 0,
-        )
-    )
+    query = _task_ratios(user_id)
     if course_id:
         query = query.where(Task.course_id == course_id)
     if task_type:
         query = query.where(Task.task_type == task_type)
+    ratios = query.subquery()
 
-    result = await session.execute(query)
-    tasks = result.scalars().all()
-
-    if not tasks:
+    result = await session.execute(select(func.avg(ratios.c.ratio), func.count()))
+    multiplier, count = result.one()
+    if not count:
         return 1.0, 0
-
-    ratios = []
-    for task in tasks:
-        log_result = await session.execute(
-            select(TimeLog).where(TimeLog.task_id == task.id, TimeLog.user_id == user_id)
-        )
-        logs = log_result.scalars().all()
-        actual_minutes = sum(l.duration_minutes for l in logs)
-        actual_hours = actual_minutes / 60
-
-        if actual_hours > 0 and task.estimated_hours:
-            ratios.append(actual_hours / task.estimated_hours)
-
-    if not ratios:
-        return 1.0, 0
-
-    multiplier = sum(ratios) / len(ratios)
-    # Clamp between 0.5 and 3.0
-    multiplier = max(0.5, min(3.0, multiplier))
-    return multiplier, len(ratios)
+    return _clamp(multiplier), count
 
 
 async def get_all_multipliers(
@@ -68,25 +71,21 @@ async def get_all_multipliers(
     user_id: int,
 ) -> list[dict]:
     """Get multipliers for all course+type combinations the user has data for."""
-    # Get distinct course_id + task_type combos from completed tasks
-    completed = await session.execute(
-        select(Task.course_id, Task.task_type)
-        .where(Task.user_id == user_id, Task.status == TaskStatus.COMPLETED)
-        .distinct()
+    ratios = _task_ratios(user_id).subquery()
+    result = await session.execute(
+        select(ratios.c.course_id, ratios.c.task_type, func.avg(ratios.c.ratio), func.count())
+        .group_by(ratios.c.course_id, ratios.c.task_type)
+        .order_by(ratios.c.course_id, ratios.c.task_type)
     )
-
-    results = []
-    for course_id, task_type in completed.all():
-        mult, count = await compute_multiplier(session, user_id, course_id, task_type)
-        if count > 0:
-            results.append({
-                "course_id": course_id,
-                "task_type": task_type,
-                "multiplier": round(mult, 2),
-                "sample_count": count,
-            })
-
-    return results
+    return [
+        {
+            "course_id": course_id,
+            "task_type": task_type,
+            "multiplier": round(_clamp(multiplier), 2),
+            "sample_count": count,
+        }
+        for course_id, task_type, multiplier, count in result.all()
+    ]
 
 
 async def update_course_multiplier(
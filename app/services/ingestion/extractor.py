@@ -3,10 +3,10 @@ Claude-powered extraction: convert document text into structured tasks and event
 """
 
 import json
-
-import anthropic
+from collections.abc import AsyncIterator
 
 from app.core.config import settings
+from app.core.llm import get_anthropic_client
 
 EXTRACTION_PROMPT = """You are an academic document parser. Analyze the following document text and extract:
 
@@ -29,32 +29,16 @@ Document text:
 """
 
 
-async def extract_from_text(text: str) -> dict:
-    """Use Claude to extract structured data from document text."""
-    if not settings.ANTHROPIC_API_KEY:
-        return {
-            "tasks": [],
-            "events": [],
-            "confidence": 0,
-            "error": "ANTHROPIC_API_KEY not configured",
-        }
-
-    client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-
-    # Truncate very long texts
-    truncated = text[:15000] if len(text) > 15000 else text
-
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=2048,
-        messages=[
-            {"role": "user", "content": EXTRACTION_PROMPT + truncated}
-        ],
-    )
+_NO_API_KEY = {
+    "tasks": [],
+    "events": [],
+    "confidence": 0,
+    "error": "ANTHROPIC_API_KEY not configured",
+}
 
-    response_text = response.content[0].text
 
-    # Parse JSON from response
+def _parse_extraction(response_text: str) -> dict:
+    """Pull the JSON object out of the model's reply."""
     try:
         # Try to find JSON in the response
         start = response_text.find("{")
@@ -67,12 +51,51 @@ async def extract_from_text(text: str) -> dict:
     return {"tasks": [], "events": [], "confidence": 0, "error": "Failed to parse response"}
 
 
+def _extraction_request(text: str) -> dict:
+    # Truncate very long texts
+    truncated = text[:15000] if len(text) > 15000 else text
+    return {
+        "model": "claude-sonnet-4-20250514",
+        "max_tokens": 2048,
+        "messages": [{"role": "user", "content": EXTRACTION_PROMPT + truncated}],
+    }
+
+
+async def extract_from_text(text: str) -> dict:
+    """Use Claude to extract structured data from document text."""
+    if not settings.ANTHROPIC_API_KEY:
+        return dict(_NO_API_KEY)
+
+    client = get_anthropic_client()
+    response = await client.messages.create(**_extraction_request(text))
+    return _parse_extraction(response.content[0].text)
+
+
+async def extract_from_text_stream(text: str) -> AsyncIterator[dict]:
+    """
+    Streaming variant of ``extract_from_text``: yields ``text`` deltas as the
+    model produces them, then one ``result`` event with the parsed extraction.
+    """
+    if not settings.ANTHROPIC_API_KEY:
+        yield {"type": "result", "data": dict(_NO_API_KEY)}
+        return
+
+    client = get_anthropic_client()
+    parts: list[str] = []
+    async with client.messages.stream(**_extraction_request(text)) as stream:
+        async for delta in stream.text_stream:
+            parts.append(delta)
+            yield {"type": "text", "content": delta}
+
+    yield {"type": "result", "data": _parse_extraction("".join(parts))}
+
+
 async def extract_syllabus(text: str) -> dict:
     """Specialized extraction for syllabi — gets exam schedule, weekly topics, office hours."""
     if not settings.ANTHROPIC_API_KEY:
         return {"tasks": [], "events": [], "confidence": 0}
 
-    client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    client = get_anthropic_client()
 
     prompt = """Analyze this syllabus and extract ALL of the following:
 
@@ -91,7 +114,7 @@ Return valid JSON:
 Syllabus text:
 """ + text[:15000]
 
-    response = client.messages.create(
+    response = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=4096,
         messages=[{"role": "user", "content": prompt}],
@@ -1,33 +1,34 @@
 """
 Document parsing: extract text from PDF, images, docs.
+
+Parsers take a binary file object (e.g. an upload's spooled temp file)
+so large uploads are read from disk rather than copied into memory.
 """
 
-import io
+import asyncio
+from typing import BinaryIO
 
 
-async def extract_text_from_pdf(file_bytes: bytes) -> str:
-    """Extract text from a PDF file. Requires PyPDF2 or similar."""
+def _pdf_text(file: BinaryIO) -> str:
     try:
         from PyPDF2 import PdfReader
 
-        reader = PdfReader(io.BytesIO(file_bytes))
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() or ""
-        return text.strip()
+        reader = PdfReader(file)
+        # Pages are parsed lazily one at a time; join once at the end rather
+        # than re-copying the accumulated text on every page
+        return "".join(page.extract_text() or "" for page in reader.pages).strip()
     except ImportError:
         return "[PDF parsing requires PyPDF2 - install with: pip install PyPDF2]"
     except Exception as e:
         return f"[Error parsing PDF: {e}]"
 
 
-async def extract_text_from_image(file_bytes: bytes) -> str:
-    """Extract text from an image using OCR. Requires pytesseract."""
+def _image_text(file: BinaryIO) -> str:
     try:
         import pytesseract
         from PIL import Image
 
-        image = Image.open(io.BytesIO(file_bytes))
+        image = Image.open(file)
         return pytesseract.image_to_string(image).strip()
     except ImportError:
         return "[Image OCR requires pytesseract and Pillow]"
@@ -35,15 +36,28 @@ async def extract_text_from_image(file_bytes: bytes) -> str:
         return f"[Error parsing image: {e}]"
 
 
-async def extract_text(file_bytes: bytes, content_type: str) -> str:
+async def extract_text_from_pdf(file: BinaryIO) -> str:
+    """Extract text from a PDF file. Requires PyPDF2 or similar."""
+    # Parsing is blocking and CPU-heavy; a worker thread keeps the event
+    # loop serving other requests meanwhile
+    return await asyncio.to_thread(_pdf_text, file)
+
+
+async def extract_text_from_image(file: BinaryIO) -> str:
+    """Extract text from an image using OCR. Requires pytesseract."""
+    # tesseract runs as a subprocess, so the thread mostly just waits on it
+    return await asyncio.to_thread(_image_text, file)
+
+
+async def extract_text(file: BinaryIO, content_type: str) -> str:
     """Route to appropriate parser based on content type."""
     if "pdf" in content_type:
-        return await extract_text_from_pdf(file_bytes)
+        return await extract_text_from_pdf(file)
     elif "image" in content_type:
-        return await extract_text_from_image(file_bytes)
+        return await extract_text_from_image(file)
     else:
         # Try to decode as text
         try:
-            return file_bytes.decode("utf-8").strip()
+            return file.read().decode("utf-8").strip()
         except UnicodeDecodeError:
             return "[Unsupported file format]"
@@ -20,9 +20,13 @@ class LMSConnector(ABC):
         ...
 
     @abstractmethod
-    async def fetch_assignments(self) -> list[dict]:
+    async def fetch_assignments(self, courses: list[dict] | None = None) -> list[dict]:
         """Fetch all assignments from the connected LMS.
 
+        Args:
+            courses: Output of fetch_courses() if the caller already has it;
+                     fetched on demand otherwise.
+
         Returns:
             List of dicts, each with at minimum:
                 - title: str
@@ -1,5 +1,6 @@
 """Canvas LMS connector implementation."""
 
+import asyncio
 import logging
 from datetime import datetime
 
@@ -9,6 +10,9 @@ from app.services.integrations.base import LMSConnector
 
 logger = logging.getLogger(__name__)
 
+# Per-course assignment requests in flight at once for one sync
+ASSIGNMENT_FETCH_CONCURRENCY = 8
+
 
 class CanvasConnector(LMSConnector):
     """Connects to Canvas LMS via its REST API.
@@ -18,10 +22,10 @@ class CanvasConnector(LMSConnector):
         - api_token: A Canvas API access token
     """
 
-    def __init__(self) -> None:
+    def __init__(self, client: httpx.AsyncClient) -> None:
         self.base_url: str = ""
         self.api_token: str = ""
-        self._client: httpx.AsyncClient | None = None
+        self._client = client
 
     @property
     def headers(self) -> dict[str, str]:
@@ -40,19 +44,18 @@ class CanvasConnector(LMSConnector):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    f"{self.base_url}/api/v1/users/self",
-                    headers=self.headers,
-                    timeout=15,
-                )
-                if resp.status_code == 200:
-                    logger.info("Canvas authentication succeeded.")
-                    return True
-                logger.warning(
-                    "Canvas authentication failed with status %d", resp.status_code
-                )
-                return False
+            resp = await self._client.get(
+                f"{self.base_url}/api/v1/users/self",
+                headers=self.headers,
+                timeout=15,
+            )
+            if resp.status_code == 200:
+                logger.info("Canvas authentication succeeded.")
+                return True
+            logger.warning(
+                "Canvas authentication failed with status %d", resp.status_code
+            )
+            return False
         except httpx.HTTPError as exc:
             logger.error("Canvas authentication error: %s", exc)
             return False
@@ -67,65 +70,75 @@ class CanvasConnector(LMSConnector):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get(
-                    url, headers=self.headers, params=params, timeout=30
-                )
-                resp.raise_for_status()
-                data = resp.json()
-
-                for course in data:
-                    courses.append({
-                        "name": course.get("name", ""),
-                        "code": course.get("course_code", ""),
-                        "external_id": str(course.get("id", "")),
-                        "term": course.get("enrollment_term_id"),
-                    })
+            resp = await self._client.get(
+                url, headers=self.headers, params=params, timeout=30
+            )
+            resp.raise_for_status()
+            data = resp.json()
+
+            for course in data:
+                courses.append({
+                    "name": course.get("name", ""),
+                    "code": course.get("course_code", ""),
+                    "external_id": str(course.get("id", "")),
+                    "term": course.get("enrollment_term_id"),
+                })
         except httpx.HTTPError as exc:
             logger.error("Failed to fetch Canvas courses: %s", exc)
 
         return courses
 
-    async def fetch_assignments(self) -> list[dict]:
-        """Fetch assignments from all active courses in Canvas."""
-        assignments: list[dict] = []
-        courses = await self.fetch_courses()
+    async def _fetch_course_assignments(self, course: dict) -> list[dict]:
+        course_id = course["external_id"]
+        url = f"{self.base_url}/api/v1/courses/{course_id}/assignments"
+        params: dict = {"per_page": 100, "order_by": "due_at"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                for course in courses:
-                    course_id = course["external_id"]
-                    url = f"{self.base_url}/api/v1/courses/{course_id}/assignments"
-                    params: dict = {"per_page": 100, "order_by": "due_at"}
-
-                    resp = await client.get(
-                        url, headers=self.headers, params=params, timeout=30
-                    )
-                    if resp.status_code != 200:
-                        logger.warning(
-                            "Skipping assignments for course %s (status %d)",
-                            course_id,
-                            resp.status_code,
-                        )
-                        continue
-
-                    data = resp.json()
-                    for assignment in data:
-                        due_at = assignment.get("due_at")
-                        due_date = (
-                            datetime.fromisoformat(due_at.replace("Z", "+00:00")).isoformat()
-                            if due_at
-                            else None
-                        )
-                        assignments.append({
-                            "title": assignment.get("name", ""),
-                            "due_date": due_date,
-                            "course_name": course["name"],
-                            "description": assignment.get("description", "") or "",
-                            "points_possible": assignment.get("points_possible"),
-                            "external_id": str(assignment.get("id", "")),
-                        })
+            resp = await self._client.get(url, headers=self.headers, params=params, timeout=30)
         except httpx.HTTPError as exc:
-            logger.error("Failed to fetch Canvas assignments: %s", exc)
+            logger.error("Failed to fetch Canvas assignments for course %s: %s", course_id, exc)
+            return []
+        if resp.status_code != 200:
+            logger.warning(
+                "Skipping assignments for course %s (status %d)",
+                course_id,
+                resp.status_code,
+            )
+            return []
 
+        assignments: list[dict] = []
+        for assignment in resp.json():
+            due_at = assignment.get("due_at")
+            due_date = (
+                datetime.fromisoformat(due_at.replace("Z", "+00:00")).isoformat()
+                if due_at
+                else None
+            )
+            assignments.append({
+                "title": assignment.get("name", ""),
+                "due_date": due_date,
+                "course_name": course["name"],
+                "description": assignment.get("description", "") or "",
+                "points_possible": assignment.get("points_possible"),
+                "external_id": str(assignment.get("id", "")),
+            })
         return assignments
+
+    async def fetch_assignments(self, courses: list[dict] | None = None) -> list[dict]:
+        """Fetch assignments from all active courses in Canvas.
+
+        Canvas has no cross-course assignments endpoint, so the per-course
+        requests are issued concurrently over one client, at most
+        ``ASSIGNMENT_FETCH_CONCURRENCY`` at a time.
+        """
+        if courses is None:
+            courses = await self.fetch_courses()
+
+        slots = asyncio.Semaphore(ASSIGNMENT_FETCH_CONCURRENCY)
+
+        async def fetch(course: dict) -> list[dict]:
+            async with slots:
+                return await self._fetch_course_assignments(course)
+
+        per_course = await asyncio.gather(*(fetch(course) for course in courses))
+        return [a for course_assignments in per_course for a in course_assignments]
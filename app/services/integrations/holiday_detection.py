@@ -5,6 +5,7 @@ provides heuristics for detecting travel/vacation periods that
 should reduce a student's available study time.
 """
 
+import functools
 import logging
 from datetime import date, timedelta
 from typing import Any
@@ -16,6 +17,17 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
+def _holidays_for_year(
+    country: str, year: int, state: str | None
+) -> tuple[tuple[date, str], ...]:
+    """Sorted (date, name) pairs; holiday rules are static, so cache per process."""
+    kwargs: dict[str, Any] = {"years": year}
+    if state:
+        kwargs["state"] = state
+    return tuple(sorted(holidays.country_holidays(country, **kwargs).items()))
+
+
 def get_holidays(
     country: str,
     year: int,
@@ -32,17 +44,10 @@ def get_holidays(
         Sorted list of dicts with 'date' (ISO string) and 'name'.
     """
     try:
-        kwargs: dict[str, Any] = {"years": year}
-        if state:
-            kwargs["state"] = state
-
-        country_holidays = holidays.country_holidays(country, **kwargs)
-
-        result = [
+        return [
             {"date": d.isoformat(), "name": name}
-            for d, name in sorted(country_holidays.items())
+            for d, name in _holidays_for_year(country, year, state)
         ]
-        return result
     except Exception as exc:
         logger.error("Failed to fetch holidays for %s/%d: %s", country, year, exc)
         return []
@@ -51,11 +56,7 @@ def get_holidays(
 def is_holiday(country: str, check_date: date, state: str | None = None) -> bool:
     """Check if a specific date is a public holiday."""
     try:
-        kwargs: dict[str, Any] = {}
-        if state:
-            kwargs["state"] = state
-        country_holidays = holidays.country_holidays(country, **kwargs)
-        return check_date in country_holidays
+        return any(d == check_date for d, _ in _holidays_for_year(country, check_date.year, state))
     except Exception:
         return False
 
@@ -84,6 +85,15 @@ async def detect_reduced_availability(
         List of dicts with 'date', 'reason', 'availability_factor' (0.0-1.0).
     """
     start_date, end_date = date_range
+    # Copies, so callers can't mutate the cached entries
+    return [dict(r) for r in _reduced_availability(start_date, end_date, country, state)]
+
+
+@functools.lru_cache(maxsize=256)
+def _reduced_availability(
+    start_date: date, end_date: date, country: str, state: str | None
+) -> tuple[dict[str, Any], ...]:
+    """Depends only on the range and region, so calendar re-queries hit the cache."""
     results: list[dict[str, Any]] = []
     seen_dates: set[date] = set()
 
@@ -99,11 +109,7 @@ async def detect_reduced_availability(
     all_holidays: dict[date, str] = {}
     for year in years:
         try:
-            kwargs: dict[str, Any] = {"years": year}
-            if state:
-                kwargs["state"] = state
-            country_holidays = holidays.country_holidays(country, **kwargs)
-            for h_date, h_name in country_holidays.items():
+            for h_date, h_name in _holidays_for_year(country, year, state):
                 if start_date <= h_date <= end_date:
                     all_holidays[h_date] = h_name
         except Exception as exc:
@@ -173,7 +179,7 @@ async def detect_reduced_availability(
 
     # Sort by date
     results.sort(key=lambda r: r["date"])
-    return results
+    return tuple(results)
 
 
 def _get_academic_break_ranges(year: int) -> list[tuple[date, date, str]]:
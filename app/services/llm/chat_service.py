@@ -1,13 +1,12 @@
 """LLM Chat service using Anthropic SDK with tool-calling."""
 
-import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-import anthropic
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.config import settings
+from app.core.llm import get_anthropic_client
 from app.models.chat import ChatMessage, ChatSession, MessageRole
 from app.models.task import Task
 from app.services.llm.tools import TOOLS
@@ -71,21 +70,35 @@ async def get_chat_history(
     result = await session.execute(
         select(ChatMessage)
         .where(ChatMessage.session_id == session_id, ChatMessage.user_id == user_id)
-        .order_by(ChatMessage.created_at)
+        .order_by(ChatMessage.created_at, ChatMessage.id)
         .limit(limit)
     )
     return list(result.scalars().all())
 
 
-async def chat(
+async def list_sessions(session: AsyncSession, user_id: int) -> list:
+    """Return (id, title, is_active, created_at, updated_at) rows, newest first."""
+    result = await session.execute(
+        select(
+            ChatSession.id,
+            ChatSession.title,
+            ChatSession.is_active,
+            ChatSession.created_at,
+            ChatSession.updated_at,
+        )
+        .where(ChatSession.user_id == user_id)
+        .order_by(ChatSession.updated_at.desc())
+    )
+    return list(result.all())
+
+
+async def _prepare_turn(
     session: AsyncSession,
     user_id: int,
     message: str,
-    session_id: int | None = None,
-) -> tuple[str, list[dict], int]:
-    """
-    Process a chat message. Returns (response_text, tool_calls, session_id).
-    """
+    session_id: int | None,
+) -> tuple[ChatSession, str, list[dict]]:
+    """Persist the user message and build (chat_session, system, messages)."""
     chat_session = await get_or_create_session(session, user_id, session_id)
 
     # Save user message
@@ -111,9 +124,41 @@ async def chat(
     for msg in history:
         messages.append({"role": msg.role, "content": msg.content})
 
+    return chat_session, system, messages
+
+
+async def _save_reply(
+    session: AsyncSession,
+    user_id: int,
+    chat_session: ChatSession,
+    response_text: str,
+    tool_calls: list[dict],
+) -> None:
+    assistant_msg = ChatMessage(
+        session_id=chat_session.id,
+        user_id=user_id,
+        role=MessageRole.ASSISTANT,
+        content=response_text,
+        tool_calls=tool_calls or None,
+    )
+    session.add(assistant_msg)
+    await session.commit()
+
+
+async def chat(
+    session: AsyncSession,
+    user_id: int,
+    message: str,
+    session_id: int | None = None,
+) -> tuple[str, list[dict], int]:
+    """
+    Process a chat message. Returns (response_text, tool_calls, session_id).
+    """
+    chat_session, system, messages = await _prepare_turn(session, user_id, message, session_id)
+
     # Call Anthropic
-    client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-    response = client.messages.create(
+    client = get_anthropic_client()
+    response = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=1024,
         system=system,
@@ -134,15 +179,45 @@ async def chat(
                 "arguments": block.input,
             })
 
-    # Save assistant message
-    assistant_msg = ChatMessage(
-        session_id=chat_session.id,
-        user_id=user_id,
-        role=MessageRole.ASSISTANT,
-        content=response_text,
-        tool_calls=json.dumps(tool_calls) if tool_calls else "",
-    )
-    session.add(assistant_msg)
-    await session.commit()
+    await _save_reply(session, user_id, chat_session, response_text, tool_calls)
 
     return response_text, tool_calls, chat_session.id
+
+
+async def chat_stream(
+    session: AsyncSession,
+    user_id: int,
+    message: str,
+    session_id: int | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Stream a chat reply as event dicts: ``text`` deltas as the model produces
+    them, then one ``tool_call`` per tool use, then ``done`` with the session id.
+    """
+    chat_session, system, messages = await _prepare_turn(session, user_id, message, session_id)
+
+    client = get_anthropic_client()
+    async with client.messages.stream(
+        model="claude-sonnet-4-20250514",
+        max_tokens=1024,
+        system=system,
+        messages=messages,
+        tools=TOOLS,
+    ) as stream:
+        async for text in stream.text_stream:
+            yield {"type": "text", "content": text}
+        final = await stream.get_final_message()
+
+    response_text = ""
+    tool_calls = []
+    for block in final.content:
+        if block.type == "text":
+            response_text += block.text
+        elif block.type == "tool_use":
+            tool_calls.append({"name": block.name, "arguments": block.input})
+
+    await _save_reply(session, user_id, chat_session, response_text, tool_calls)
+
+    for tc in tool_calls:
+        yield {"type": "tool_call", **tc}
+    yield {"type": "done", "session_id": chat_session.id}
@@ -1,7 +1,9 @@
 import json
 from datetime import UTC, datetime
 
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from sqlmodel import select
 
 from app.models.plan_version import PlanVersion
@@ -62,10 +64,12 @@ async def rollback_to_version(
 ) -> PlanVersion:
     # Get target version
     result = await session.execute(
-        select(PlanVersion).where(
+        select(PlanVersion)
+        .where(
             PlanVersion.id == version_id,
             PlanVersion.user_id == user_id,
         )
+        .options(undefer(PlanVersion.snapshot))
     )
     target_version = result.scalar_one_or_none()
     if target_version is None:
@@ -76,26 +80,22 @@ async def rollback_to_version(
         session, user_id, trigger=f"rollback_to_v{target_version.version_number}"
     )
 
-    # Delete current blocks
-    current_blocks = await session.execute(
-        select(StudyBlock).where(StudyBlock.user_id == user_id)
-    )
-    for block in current_blocks.scalars().all():
-        await session.delete(block)
-
-    # Restore blocks from snapshot
-    snapshot_blocks = json.loads(target_version.snapshot)
-    for block_data in snapshot_blocks:
-        block = StudyBlock(
-            user_id=user_id,
-            task_id=block_data["task_id"],
-            plan_version_id=rollback_version.id,
-            start=datetime.fromisoformat(block_data["start"]),
-            end=datetime.fromisoformat(block_data["end"]),
-            block_index=block_data["block_index"],
-            is_pinned=block_data.get("is_pinned", False),
-        )
-        session.add(block)
+    # Replace current blocks with the snapshot in two statements
+    await session.execute(delete(StudyBlock).where(StudyBlock.user_id == user_id))
+    rows = [
+        {
+            "user_id": user_id,
+            "task_id": block_data["task_id"],
+            "plan_version_id": rollback_version.id,
+            "start": datetime.fromisoformat(block_data["start"]),
+            "end": datetime.fromisoformat(block_data["end"]),
+            "block_index": block_data["block_index"],
+            "is_pinned": block_data.get("is_pinned", False),
+        }
+        for block_data in json.loads(target_version.snapshot)
+    ]
+    if rows:
+        await session.execute(insert(StudyBlock).values(rows))
 
     await session.flush()
     return rollback_version
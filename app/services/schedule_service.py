@@ -1,18 +1,51 @@
 from datetime import datetime
 
+import orjson
+from redis.asyncio import Redis
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.models.course import Course
 from app.models.study_block import StudyBlock
 from app.models.task import Task
-from app.schemas.availability import AvailabilityGridSchema, SchedulingRulesSchema
 from app.schemas.schedule import PlanDiffResponse
 from app.services.availability_service import get_availability_grid, get_scheduling_rules
 from app.services.plan_versioning import create_plan_version
 from app.services.scheduler.diff import compute_diff
 from app.services.scheduler.engine import ScheduledBlock, generate_plan
 
+PREVIEW_TTL_SECONDS = 600
+
+
+def _preview_key(user_id: int) -> str:
+    return f"preview:plan:{user_id}"
+
+
+async def save_preview(redis: Redis, user_id: int, blocks: list[ScheduledBlock]) -> None:
+    """Stash a generated-but-unconfirmed plan; it expires if never confirmed."""
+    payload = orjson.dumps([
+        {"task_id": b.task_id, "start": b.start, "end": b.end, "block_index": b.block_index}
+        for b in blocks
+    ])
+    await redis.set(_preview_key(user_id), payload, ex=PREVIEW_TTL_SECONDS)
+
+
+async def pop_preview(redis: Redis, user_id: int) -> list[ScheduledBlock] | None:
+    """Take the user's previewed plan, or None if there is none (or it expired)."""
+    payload = await redis.getdel(_preview_key(user_id))
+    if payload is None:
+        return None
+    return [
+        ScheduledBlock(
+            task_id=b["task_id"],
+            start=datetime.fromisoformat(b["start"]),
+            end=datetime.fromisoformat(b["end"]),
+            block_index=b["block_index"],
+        )
+        for b in orjson.loads(payload)
+    ]
+
 
 async def get_task_titles(session: AsyncSession, user_id: int) -> dict[int, str]:
     result = await session.execute(select(Task).where(Task.user_id == user_id))
@@ -28,6 +61,41 @@ async def get_current_blocks(session: AsyncSession, user_id: int) -> list[StudyB
     return list(result.scalars().all())
 
 
+async def get_blocks_with_labels(
+    session: AsyncSession,
+    user_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[tuple[StudyBlock, str | None, str | None, str | None]]:
+    """Blocks inside [start, end] (either bound optional) with their task title
+    and course name/color, joined in the same query."""
+    query = (
+        select(StudyBlock, Task.title, Course.name, Course.color)
+        .outerjoin(Task, Task.id == StudyBlock.task_id)
+        .outerjoin(Course, Course.id == Task.course_id)
+        .where(StudyBlock.user_id == user_id)
+    )
+    if start:
+        query = query.where(StudyBlock.start >= start)
+    if end:
+        query = query.where(StudyBlock.end <= end)
+    result = await session.execute(query.order_by(StudyBlock.start))
+    return [tuple(row) for row in result.all()]
+
+
+async def get_task_labels(
+    session: AsyncSession, task_id: int
+) -> tuple[str | None, str | None, str | None]:
+    """One task's title and course name/color."""
+    result = await session.execute(
+        select(Task.title, Course.name, Course.color)
+        .outerjoin(Course, Course.id == Task.course_id)
+        .where(Task.id == task_id)
+    )
+    row = result.first()
+    return tuple(row) if row else (None, None, None)
+
+
 async def generate_new_plan(
     session: AsyncSession,
     user_id: int,
@@ -46,7 +114,7 @@ async def generate_new_plan(
 
     # Get pinned blocks
     pinned_result = await session.execute(
-        select(StudyBlock).where(StudyBlock.user_id == user_id, StudyBlock.is_pinned == True)
+        select(StudyBlock).where(StudyBlock.user_id == user_id, StudyBlock.is_pinned.is_(True))
     )
     pinned_db = list(pinned_result.scalars().all())
     pinned = [
@@ -80,30 +148,26 @@ async def confirm_plan(
 
     version = await create_plan_version(session, user_id, trigger=reason, diff_summary=summary)
 
-    # Delete old non-pinned blocks
-    for block in old_blocks:
-        if not block.is_pinned:
-            await session.delete(block)
-
-    # Insert new blocks
-    for nb in new_blocks:
-        # Skip pinned blocks (already exist)
-        is_existing_pinned = any(
-            b.task_id == nb.task_id and b.start == nb.start and b.is_pinned
-            for b in old_blocks
-        )
-        if is_existing_pinned:
-            continue
-
-        block = StudyBlock(
-            user_id=user_id,
-            task_id=nb.task_id,
-            plan_version_id=version.id,
-            start=nb.start,
-            end=nb.end,
-            block_index=nb.block_index,
-        )
-        session.add(block)
+    # Replace non-pinned blocks with one DELETE and one multi-row INSERT;
+    # pinned blocks already exist and are kept as-is
+    await session.execute(
+        delete(StudyBlock).where(StudyBlock.user_id == user_id, StudyBlock.is_pinned.is_(False))
+    )
+    pinned = {(b.task_id, b.start) for b in old_blocks if b.is_pinned}
+    rows = [
+        {
+            "user_id": user_id,
+            "task_id": nb.task_id,
+            "plan_version_id": version.id,
+            "start": nb.start,
+            "end": nb.end,
+            "block_index": nb.block_index,
+        }
+        for nb in new_blocks
+        if (nb.task_id, nb.start) not in pinned
+    ]
+    if rows:
+        await session.execute(insert(StudyBlock).values(rows))
 
     await session.commit()
     return version.id
@@ -127,7 +191,6 @@ async def move_block(
     block.start = new_start
     block.end = new_end
     block.is_pinned = True
-    block.updated_at = datetime.utcnow()
     await session.commit()
     await session.refresh(block)
     return block
@@ -1,8 +1,10 @@
 from datetime import datetime
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.models.defaults import UtcNow
 from app.models.tag import TaskTag
 from app.models.task import Task, TaskStatus
 from app.schemas.task import TaskCreate, TaskUpdate
@@ -43,22 +45,30 @@ async def list_tasks(
     offset: int = 0,
     limit: int = 50,
 ) -> tuple[list[Task], int]:
-    from sqlalchemy import func
-
-    base = select(Task).where(Task.user_id == user_id)
+    filters = [Task.user_id == user_id]
     if status:
-        base = base.where(Task.status == status)
+        filters.append(Task.status == status)
     if course_id:
-        base = base.where(Task.course_id == course_id)
-
-    # Count total
-    count_q = select(func.count()).select_from(base.subquery())
-    total = (await session.execute(count_q)).scalar_one()
+        filters.append(Task.course_id == course_id)
+
+    # The session can't run the count and the page concurrently, so carry
+    # the total on each page row as COUNT(*) OVER () — one round trip
+    query = (
+        select(Task, func.count().over())
+        .where(*filters)
+        .order_by(Task.due_date.asc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = (await session.execute(query)).all()
+    if rows:
+        return [task for task, _ in rows], rows[0][1]
+    if offset == 0:
+        return [], 0
 
-    # Fetch page
-    query = base.order_by(Task.due_date.asc()).offset(offset).limit(limit)
-    result = await session.execute(query)
-    return list(result.scalars().all()), total
+    # Paged past the end: no rows to carry the total
+    count_q = select(func.count()).select_from(Task).where(*filters)
+    return [], (await session.execute(count_q)).scalar_one()
 
 
 async def get_task(session: AsyncSession, user_id: int, task_id: int) -> Task | None:
@@ -68,19 +78,36 @@ async def get_task(session: AsyncSession, user_id: int, task_id: int) -> Task |
     return result.scalar_one_or_none()
 
 
+async def get_task_with_tags(
+    session: AsyncSession, user_id: int, task_id: int
+) -> tuple[Task, list[int]] | None:
+    """Fetch a task and its tag IDs in a single query (one row per tag)."""
+    result = await session.execute(
+        select(Task, TaskTag.tag_id)
+        .outerjoin(TaskTag, TaskTag.task_id == Task.id)
+        .where(Task.id == task_id, Task.user_id == user_id)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    return rows[0][0], [tag_id for _, tag_id in rows if tag_id is not None]
+
+
 async def update_task(
     session: AsyncSession, user_id: int, task_id: int, data: TaskUpdate
-) -> Task | None:
-    task = await get_task(session, user_id, task_id)
-    if not task:
+) -> tuple[Task, list[int]] | None:
+    found = await get_task_with_tags(session, user_id, task_id)
+    if not found:
         return None
+    task, current_tag_ids = found
 
     update_data = data.model_dump(exclude_unset=True)
     tag_ids = update_data.pop("tag_ids", None)
 
     for key, value in update_data.items():
         setattr(task, key, value)
-    task.updated_at = datetime.utcnow()
+    # A tag-only edit leaves the row unchanged, so bump it explicitly
+    task.updated_at = UtcNow()
 
     if tag_ids is not None:
         # Remove existing tags
@@ -94,8 +121,7 @@ async def update_task(
             session.add(TaskTag(task_id=task_id, tag_id=tid))
 
     await session.commit()
-    await session.refresh(task)
-    return task
+    return task, tag_ids if tag_ids is not None else current_tag_ids
 
 
 async def delete_task(session: AsyncSession, user_id: int, task_id: int) -> bool:
@@ -107,35 +133,30 @@ async def delete_task(session: AsyncSession, user_id: int, task_id: int) -> bool
     return True
 
 
-async def complete_task(session: AsyncSession, user_id: int, task_id: int) -> Task | None:
-    task = await get_task(session, user_id, task_id)
-    if not task:
+async def complete_task(
+    session: AsyncSession, user_id: int, task_id: int
+) -> tuple[Task, list[int]] | None:
+    found = await get_task_with_tags(session, user_id, task_id)
+    if not found:
         return None
+    task, tag_ids = found
     task.status = TaskStatus.COMPLETED
     task.completed_at = datetime.utcnow()
-    task.updated_at = datetime.utcnow()
     await session.commit()
-    await session.refresh(task)
-    return task
+    return task, tag_ids
 
 
 async def add_time_to_task(
     session: AsyncSession, user_id: int, task_id: int, additional_hours: float
-) -> Task | None:
-    task = await get_task(session, user_id, task_id)
-    if not task:
+) -> tuple[Task, list[int]] | None:
+    found = await get_task_with_tags(session, user_id, task_id)
+    if not found:
         return None
+    task, tag_ids = found
     current = task.estimated_hours or 0
     task.estimated_hours = current + additional_hours
-    task.updated_at = datetime.utcnow()
     await session.commit()
-    await session.refresh(task)
-    return task
-
-
-async def get_task_tag_ids(session: AsyncSession, task_id: int) -> list[int]:
-    result = await session.execute(select(TaskTag).where(TaskTag.task_id == task_id))
-    return [tt.tag_id for tt in result.scalars().all()]
+    return task, tag_ids
 
 
 async def get_task_tag_ids_batch(
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -88,8 +89,24 @@ async def get_total_logged_minutes(
     user_id: int,
     task_id: int,
 ) -> float:
+    totals = await get_total_minutes_batch(session, user_id, [task_id])
+    return totals[task_id]
+
+
+async def get_total_minutes_batch(
+    session: AsyncSession,
+    user_id: int,
+    task_ids: list[int],
+) -> dict[int, float]:
+    """Logged minutes per task in one aggregate query; tasks with no logs get 0."""
+    totals: dict[int, float] = {tid: 0.0 for tid in task_ids}
+    if not task_ids:
+        return totals
     result = await session.execute(
-        select(TimeLog).where(TimeLog.user_id == user_id, TimeLog.task_id == task_id)
+        select(TimeLog.task_id, func.sum(TimeLog.duration_minutes))
+        .where(TimeLog.user_id == user_id, TimeLog.task_id.in_(task_ids))
+        .group_by(TimeLog.task_id)
     )
-    logs = result.scalars().all()
-    return sum(l.duration_minutes for l in logs)
+    for task_id, minutes in result.all():
+        totals[task_id] = minutes or 0.0
+    return totals
@@ -4,6 +4,7 @@ Uses Claude to generate high-quality flashcards from study material,
 and implements the SM-2 algorithm for adaptive review scheduling.
 """
 
+import asyncio
 import json
 import logging
 import math
@@ -15,6 +16,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.llm import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -39,44 +41,25 @@ Student's quality rating: {quality}/5
 Provide a short (1-2 sentence) review note."""
 
 
-async def generate_flashcards(
-    material_text: str,
-    count: int = 10,
-    course_name: str | None = None,
-    topic: str | None = None,
-) -> list[dict[str, str]]:
-    """Generate flashcards from study material using Claude.
+# Cards requested per Claude call; larger decks fan out over parallel calls
+FLASHCARDS_PER_CALL = 10
+# Shared across all requests in the process to stay inside Anthropic rate limits
+_generation_slots = asyncio.Semaphore(8)
 
-    Args:
-        material_text: The source text to generate flashcards from.
-        count: Number of flashcards to generate.
-        course_name: Optional course name for context.
-        topic: Optional topic focus.
-
-    Returns:
-        List of dicts with 'front' and 'back' keys.
-    """
-    context_parts = []
-    if course_name:
-        context_parts.append(f"Course: {course_name}")
-    if topic:
-        context_parts.append(f"Topic focus: {topic}")
-    context_header = "\n".join(context_parts) + "\n\n" if context_parts else ""
-
-    user_message = (
-        f"{context_header}"
-        f"Create exactly {count} flashcards from the following material:\n\n"
-        f"{material_text[:8000]}"  # Limit input to avoid token overflow
-    )
 
+async def _generate_batch(
+    client: anthropic.AsyncAnthropic,
+    system: list[dict[str, Any]],
+    user_message: str,
+) -> list[dict[str, str]]:
     try:
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            system=FLASHCARD_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-        )
+        async with _generation_slots:
+            response = await client.messages.create(
+                model=settings.ANTHROPIC_MODEL_DEFAULT,
+                max_tokens=2048,
+                system=system,
+                messages=[{"role": "user", "content": user_message}],
+            )
 
         raw_text = response.content[0].text.strip()
 
@@ -91,8 +74,6 @@ async def generate_flashcards(
                     "front": str(card["front"]),
                     "back": str(card["back"]),
                 })
-
-        logger.info("Generated %d flashcards (requested %d)", len(validated), count)
         return validated
 
     except json.JSONDecodeError as exc:
@@ -103,6 +84,75 @@ async def generate_flashcards(
         return []
 
 
+async def generate_flashcards(
+    material_text: str,
+    count: int = 10,
+    course_name: str | None = None,
+    topic: str | None = None,
+) -> list[dict[str, str]]:
+    """Generate flashcards from study material using Claude.
+
+    Requests above ``FLASHCARDS_PER_CALL`` cards are split across concurrent
+    calls (each focused on a different part of the material) and merged.
+
+    Args:
+        material_text: The source text to generate flashcards from.
+        count: Number of flashcards to generate.
+        course_name: Optional course name for context.
+        topic: Optional topic focus.
+
+    Returns:
+        List of dicts with 'front' and 'back' keys.
+    """
+    context_parts = []
+    if course_name:
+        context_parts.append(f"Course: {course_name}")
+    if topic:
+        context_parts.append(f"Topic focus: {topic}")
+    context_header = "\n".join(context_parts) + "\n\n" if context_parts else ""
+    material = material_text[:8000]  # Limit input to avoid token overflow
+
+    # The material is identical across batches (and repeat requests), so it
+    # sits in a cached system block; only the per-batch instruction varies
+    system = [
+        {"type": "text", "text": FLASHCARD_SYSTEM_PROMPT},
+        {
+            "type": "text",
+            "text": f"{context_header}Study material:\n\n{material}",
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+    # Split count as evenly as possible, e.g. 25 -> [9, 8, 8]
+    batches = math.ceil(count / FLASHCARDS_PER_CALL)
+    sizes = [count // batches + (1 if i < count % batches else 0) for i in range(batches)]
+
+    messages = []
+    for i, size in enumerate(sizes):
+        focus = (
+            f"Focus on part {i + 1} of {batches} of the material.\n"
+            if batches > 1
+            else ""
+        )
+        messages.append(f"{focus}Create exactly {size} flashcards from the study material.")
+
+    client = get_anthropic_client()
+    results = await asyncio.gather(*(_generate_batch(client, system, m) for m in messages))
+
+    # Merge, dropping cards that more than one batch produced
+    cards: list[dict[str, str]] = []
+    seen: set[str] = set()
+    for card in (c for batch in results for c in batch):
+        key = " ".join(card["front"].lower().split())
+        if key not in seen:
+            seen.add(key)
+            cards.append(card)
+    cards = cards[:count]
+
+    logger.info("Generated %d flashcards (requested %d)", len(cards), count)
+    return cards
+
+
 async def grade_flashcard(
     card_id: int,
     quality: int,
@@ -4,8 +4,10 @@ Uses Claude to generate practice exams with multiple question types
 (MCQ, short_answer, essay) and provides detailed grading feedback.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 import anthropic
@@ -13,6 +15,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.llm import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -119,9 +122,15 @@ async def generate_practice_exam(
     topics_str = ", ".join(topics)
     types_str = ", ".join(question_types)
 
-    context_section = ""
+    # Course material is reused across exams for the same course, so it goes
+    # in a cached system block ahead of the per-exam parameters
+    system: list[dict[str, Any]] = [{"type": "text", "text": EXAM_GENERATION_SYSTEM}]
     if course_context:
-        context_section = f"\n\nCourse material context:\n{course_context[:6000]}"
+        system.append({
+            "type": "text",
+            "text": f"Course material context:\n{course_context[:6000]}",
+            "cache_control": {"type": "ephemeral"},
+        })
 
     user_message = (
         f"Generate a practice exam with the following parameters:\n"
@@ -129,15 +138,14 @@ async def generate_practice_exam(
         f"- Number of questions: {num_questions}\n"
         f"- Question types: {types_str}\n"
         f"- Difficulty: {difficulty}\n"
-        f"{context_section}"
     )
 
     try:
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
+        client = get_anthropic_client()
+        response = await client.messages.create(
+            model=settings.ANTHROPIC_MODEL_DEFAULT,
             max_tokens=4096,
-            system=EXAM_GENERATION_SYSTEM,
+            system=system,
             messages=[{"role": "user", "content": user_message}],
         )
 
@@ -176,17 +184,47 @@ async def generate_practice_exam(
         }
 
 
+# Questions per grading call; longer exams are graded in parallel chunks
+GRADING_QUESTIONS_PER_CALL = 10
+GRADING_CONCURRENCY = 4
+
+
+async def _grade_chunk(
+    client: anthropic.AsyncAnthropic,
+    slots: asyncio.Semaphore,
+    grading_items: list[dict[str, Any]],
+) -> dict[str, Any]:
+    user_message = (
+        f"Grade the following exam answers:\n\n"
+        f"{json.dumps(grading_items, indent=2)}"
+    )
+    async with slots:
+        response = await client.messages.create(
+            model=settings.ANTHROPIC_MODEL_DEFAULT,
+            max_tokens=4096,
+            system=GRADING_SYSTEM,
+            messages=[{"role": "user", "content": user_message}],
+        )
+    return json.loads(response.content[0].text.strip())
+
+
 async def grade_exam(
     exam_id: int | None,
     exam_data: dict[str, Any],
     answers: dict[int, str],
+    on_progress: Callable[[list[dict[str, Any]]], None] | None = None,
 ) -> dict[str, Any]:
     """Grade a student's answers against the exam.
 
+    Questions are graded in chunks of ``GRADING_QUESTIONS_PER_CALL`` over
+    concurrent Claude calls; a chunk that fails falls back to MCQ-only grading.
+
     Args:
         exam_id: Optional stored exam ID.
         exam_data: The full exam dict (with questions and model answers).
         answers: Dict mapping question_id -> student's answer text.
+        on_progress: Optional callback receiving the per-question results
+                     graded so far, called as each chunk finishes.
 
     Returns:
         Grading results with per-question feedback and overall score.
@@ -202,54 +240,68 @@ async def grade_exam(
             "overall_feedback": "No questions in the exam.",
         }
 
-    # Build grading context
-    grading_items = []
-    for q in questions:
-        q_id = q.get("id", 0)
-        student_answer = answers.get(q_id, "[No answer provided]")
-        grading_items.append({
-            "question_id": q_id,
-            "type": q.get("type"),
-            "question": q.get("question"),
-            "correct_answer": q.get("correct_answer") or q.get("model_answer", ""),
-            "key_points": q.get("key_points", []),
-            "points": q.get("points", 1),
-            "student_answer": student_answer,
-        })
-
-    user_message = (
-        f"Grade the following exam answers:\n\n"
-        f"{json.dumps(grading_items, indent=2)}"
-    )
+    # Runs inside a Celery task's own event loop (asyncio.run), so it can't
+    # borrow the API process's shared client; it's closed once grading is done
+    client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    slots = asyncio.Semaphore(GRADING_CONCURRENCY)
+    results: list[dict[str, Any]] = []
+    feedback: list[str] = []
+
+    async def grade(chunk: list[dict]) -> None:
+        # Build grading context
+        grading_items = []
+        for q in chunk:
+            q_id = q.get("id", 0)
+            student_answer = answers.get(q_id, "[No answer provided]")
+            grading_items.append({
+                "question_id": q_id,
+                "type": q.get("type"),
+                "question": q.get("question"),
+                "correct_answer": q.get("correct_answer") or q.get("model_answer", ""),
+                "key_points": q.get("key_points", []),
+                "points": q.get("points", 1),
+                "student_answer": student_answer,
+            })
 
+        try:
+            graded = await _grade_chunk(client, slots, grading_items)
+            results.extend(graded.get("results", []))
+            if graded.get("overall_feedback"):
+                feedback.append(graded["overall_feedback"])
+        except (json.JSONDecodeError, anthropic.APIError) as exc:
+            logger.error("Claude grading failed for exam %s, using fallback: %s", exam_id, exc)
+            fallback = _fallback_grading(exam_id, chunk, answers)
+            results.extend(fallback["results"])
+            feedback.append(fallback["overall_feedback"])
+
+        if on_progress is not None:
+            on_progress(sorted(results, key=lambda r: r.get("question_id", 0)))
+
+    chunks = [
+        questions[i:i + GRADING_QUESTIONS_PER_CALL]
+        for i in range(0, len(questions), GRADING_QUESTIONS_PER_CALL)
+    ]
     try:
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            system=GRADING_SYSTEM,
-            messages=[{"role": "user", "content": user_message}],
-        )
-
-        raw_text = response.content[0].text.strip()
-        grading_result = json.loads(raw_text)
+        await asyncio.gather(*(grade(chunk) for chunk in chunks))
+    finally:
+        await client.close()
 
-        grading_result["exam_id"] = exam_id
-        logger.info(
-            "Graded exam %s: %s/%s (%.1f%%)",
-            exam_id,
-            grading_result.get("total_score"),
-            grading_result.get("total_possible"),
-            grading_result.get("percentage", 0),
-        )
-        return grading_result
+    results.sort(key=lambda r: r.get("question_id", 0))
+    total_score = sum(r.get("points_awarded", 0) for r in results)
+    total_possible = sum(q.get("points", 1) for q in questions)
+    percentage = (total_score / total_possible * 100) if total_possible > 0 else 0.0
 
-    except json.JSONDecodeError as exc:
-        logger.error("Failed to parse grading JSON from Claude: %s", exc)
-        return _fallback_grading(exam_id, questions, answers)
-    except anthropic.APIError as exc:
-        logger.error("Anthropic API error grading exam: %s", exc)
-        return _fallback_grading(exam_id, questions, answers)
+    logger.info(
+        "Graded exam %s: %s/%s (%.1f%%)", exam_id, total_score, total_possible, percentage
+    )
+    return {
+        "exam_id": exam_id,
+        "results": results,
+        "total_score": total_score,
+        "total_possible": total_possible,
+        "percentage": round(percentage, 1),
+        "overall_feedback": "\n\n".join(dict.fromkeys(feedback)),
+    }
 
 
 def _fallback_grading(
@@ -0,0 +1,43 @@
+"""Model routing for tutor requests.
+
+Short Socratic nudges and ELI5 explanations don't need Sonnet-level
+reasoning, so they go to the faster, cheaper simple model. Generation
+and grading always use the default model.
+"""
+
+from app.core.config import settings
+
+# Values accepted from the X-Tutor-Model override header
+MODEL_TIERS = ("simple", "default")
+
+# Questions longer than this get the default model even at the nudge level
+SIMPLE_QUESTION_MAX_CHARS = 300
+
+
+def pick_model(
+    hint_level: str | None = None,
+    question: str = "",
+    level: str | None = None,
+    override: str | None = None,
+) -> str:
+    """Choose the Claude model for a Socratic turn or an explanation.
+
+    Args:
+        hint_level: Socratic hint level, if this is a Socratic turn.
+        question: The student's question (only its length is used).
+        level: Explanation level, if this is an explanation.
+        override: 'simple' or 'default' to bypass the heuristic.
+
+    Returns:
+        The model name to send to Anthropic.
+    """
+    if override == "simple":
+        return settings.ANTHROPIC_MODEL_SIMPLE
+    if override == "default":
+        return settings.ANTHROPIC_MODEL_DEFAULT
+
+    if hint_level == "nudge" and len(question) < SIMPLE_QUESTION_MAX_CHARS:
+        return settings.ANTHROPIC_MODEL_SIMPLE
+    if level == "eli5":
+        return settings.ANTHROPIC_MODEL_SIMPLE
+    return settings.ANTHROPIC_MODEL_DEFAULT
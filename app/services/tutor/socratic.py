@@ -5,12 +5,18 @@ answers, the tutor leads the student through the reasoning process
 with calibrated hints.
 """
 
+import hashlib
+import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import anthropic
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
-from app.core.config import settings
+from app.core.llm import get_anthropic_client
+from app.services.tutor.routing import pick_model
 
 logger = logging.getLogger(__name__)
 
@@ -51,13 +57,12 @@ Core principles:
 4. Encourage the student to reason through problems step by step.
 5. Celebrate correct reasoning and gently redirect incorrect reasoning.
 
-Hint level for this response: {hint_level}
-Hint instructions: {hint_instruction}
-
-{context_section}
-
 Be warm, encouraging, and patient. Use analogies when helpful. Keep your response focused and not too long."""
 
+# Sent after the (cached) prompt and course context, since it changes per turn
+SOCRATIC_HINT_PROMPT = """Hint level for this response: {hint_level}
+Hint instructions: {hint_instruction}"""
+
 EXPLAIN_SYSTEM_PROMPT = """You are an expert tutor who can explain concepts at different levels of complexity.
 
 Explanation level: {level}
@@ -69,29 +74,31 @@ Level descriptions:
 
 Provide a clear, well-structured explanation at the requested level. Use examples when helpful."""
 
+EXPLAIN_LEVELS = {"eli5", "undergrad", "expert"}
 
-async def socratic_response(
-    question: str,
-    context: str | None = None,
-    hint_level: str = "nudge",
-    conversation_history: list[dict[str, str]] | None = None,
-    course_name: str | None = None,
-) -> dict[str, Any]:
-    """Generate a Socratic tutoring response.
+# Explanations don't depend on the student, so identical requests share one
+EXPLAIN_CACHE_TTL_SECONDS = 24 * 60 * 60
 
-    Args:
-        question: The student's question or current statement.
-        context: Optional course material context for grounded responses.
-        hint_level: One of 'nudge', 'partial', 'full_explanation'.
-        conversation_history: Previous messages in the tutoring conversation.
-        course_name: Optional course name for context.
 
-    Returns:
-        Dict with 'response', 'hint_level', 'follow_up_question'.
-    """
-    if hint_level not in HINT_LEVELS:
-        hint_level = "nudge"
+SOCRATIC_FALLBACK = {
+    "response": (
+        "I'm having trouble connecting right now. "
+        "Let's try a different approach: can you tell me what you already "
+        "know about this topic? That will help me guide you better."
+    ),
+    "follow_up_question": "What do you already know about this?",
+}
+
 
+def _socratic_request(
+    question: str,
+    context: str | None,
+    hint_level: str,
+    conversation_history: list[dict[str, str]] | None,
+    course_name: str | None,
+    model_override: str | None,
+) -> dict[str, Any]:
+    """Build the ``messages.create`` kwargs shared by the blocking and streaming paths."""
     hint_info = HINT_LEVELS[hint_level]
 
     # Build context section
@@ -100,13 +107,20 @@ async def socratic_response(
         context_parts.append(f"Course: {course_name}")
     if context:
         context_parts.append(f"Relevant material:\n{context[:4000]}")
-    context_section = "\n".join(context_parts) if context_parts else ""
 
-    system = SOCRATIC_SYSTEM_PROMPT.format(
-        hint_level=hint_info["description"],
-        hint_instruction=hint_info["instruction"],
-        context_section=context_section,
-    )
+    # Stable prefix first so every turn of a session reuses the cached
+    # prompt + material; the hint level goes last as it varies per turn
+    system: list[dict[str, Any]] = [{"type": "text", "text": SOCRATIC_SYSTEM_PROMPT}]
+    if context_parts:
+        system.append({"type": "text", "text": "\n".join(context_parts)})
+    system[-1]["cache_control"] = {"type": "ephemeral"}
+    system.append({
+        "type": "text",
+        "text": SOCRATIC_HINT_PROMPT.format(
+            hint_level=hint_info["description"],
+            hint_instruction=hint_info["instruction"],
+        ),
+    })
 
     # Build message list
     messages: list[dict[str, str]] = []
@@ -119,14 +133,45 @@ async def socratic_response(
 
     messages.append({"role": "user", "content": question})
 
+    return {
+        "model": pick_model(hint_level=hint_level, question=question, override=model_override),
+        "max_tokens": 1024,
+        "system": system,
+        "messages": messages,
+    }
+
+
+async def socratic_response(
+    question: str,
+    context: str | None = None,
+    hint_level: str = "nudge",
+    conversation_history: list[dict[str, str]] | None = None,
+    course_name: str | None = None,
+    model_override: str | None = None,
+) -> dict[str, Any]:
+    """Generate a Socratic tutoring response.
+
+    Args:
+        question: The student's question or current statement.
+        context: Optional course material context for grounded responses.
+        hint_level: One of 'nudge', 'partial', 'full_explanation'.
+        conversation_history: Previous messages in the tutoring conversation.
+        course_name: Optional course name for context.
+        model_override: 'simple' or 'default' to bypass model routing.
+
+    Returns:
+        Dict with 'response', 'hint_level', 'follow_up_question'.
+    """
+    if hint_level not in HINT_LEVELS:
+        hint_level = "nudge"
+
+    request = _socratic_request(
+        question, context, hint_level, conversation_history, course_name, model_override
+    )
+
     try:
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            system=system,
-            messages=messages,
-        )
+        client = get_anthropic_client()
+        response = await client.messages.create(**request)
 
         response_text = response.content[0].text.strip()
 
@@ -143,16 +188,87 @@ async def socratic_response(
 
     except anthropic.APIError as exc:
         logger.error("Anthropic API error in Socratic tutor: %s", exc)
-        return {
-            "response": (
-                "I'm having trouble connecting right now. "
-                "Let's try a different approach: can you tell me what you already "
-                "know about this topic? That will help me guide you better."
-            ),
-            "hint_level": hint_level,
-            "follow_up_question": "What do you already know about this?",
-            "error": str(exc),
-        }
+        return {**SOCRATIC_FALLBACK, "hint_level": hint_level, "error": str(exc)}
+
+
+async def socratic_response_stream(
+    question: str,
+    context: str | None = None,
+    hint_level: str = "nudge",
+    conversation_history: list[dict[str, str]] | None = None,
+    course_name: str | None = None,
+    model_override: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Streaming variant of ``socratic_response``.
+
+    Yields ``text`` deltas as the model produces them, then one ``done`` event
+    carrying 'hint_level' and 'follow_up_question'.
+    """
+    if hint_level not in HINT_LEVELS:
+        hint_level = "nudge"
+
+    request = _socratic_request(
+        question, context, hint_level, conversation_history, course_name, model_override
+    )
+
+    parts: list[str] = []
+    try:
+        client = get_anthropic_client()
+        async with client.messages.stream(**request) as stream:
+            async for delta in stream.text_stream:
+                parts.append(delta)
+                yield {"type": "text", "content": delta}
+    except anthropic.APIError as exc:
+        logger.error("Anthropic API error in Socratic tutor: %s", exc)
+        # Only fall back if nothing reached the client yet
+        if not parts:
+            yield {"type": "text", "content": SOCRATIC_FALLBACK["response"]}
+            yield {
+                "type": "done",
+                "hint_level": hint_level,
+                "follow_up_question": SOCRATIC_FALLBACK["follow_up_question"],
+                "error": str(exc),
+            }
+        else:
+            yield {"type": "error", "error": str(exc)}
+        return
+
+    yield {
+        "type": "done",
+        "hint_level": hint_level,
+        "follow_up_question": _extract_follow_up("".join(parts).strip()),
+    }
+
+
+def _explain_request(
+    concept: str,
+    level: str,
+    course_name: str | None,
+    context: str | None,
+    model_override: str | None,
+) -> dict[str, Any]:
+    """Build the ``messages.create`` kwargs shared by the blocking and streaming paths."""
+    system: list[dict[str, Any]] = [
+        {"type": "text", "text": EXPLAIN_SYSTEM_PROMPT.format(level=level)}
+    ]
+    if context:
+        # Reused when several concepts from the same material are explained
+        system.append({
+            "type": "text",
+            "text": f"Relevant context:\n{context[:4000]}",
+            "cache_control": {"type": "ephemeral"},
+        })
+
+    user_message_parts = [f"Explain: {concept}"]
+    if course_name:
+        user_message_parts.append(f"(In the context of: {course_name})")
+
+    return {
+        "model": pick_model(level=level, override=model_override),
+        "max_tokens": 2048,
+        "system": system,
+        "messages": [{"role": "user", "content": "\n".join(user_message_parts)}],
+    }
 
 
 async def explain_concept(
@@ -160,6 +276,7 @@ async def explain_concept(
     level: str = "undergrad",
     course_name: str | None = None,
     context: str | None = None,
+    model_override: str | None = None,
 ) -> dict[str, Any]:
     """Explain a concept at a specified complexity level.
 
@@ -168,31 +285,18 @@ async def explain_concept(
         level: One of 'eli5', 'undergrad', 'expert'.
         course_name: Optional course context.
         context: Optional relevant material.
+        model_override: 'simple' or 'default' to bypass model routing.
 
     Returns:
         Dict with 'explanation', 'level', 'key_takeaways'.
     """
-    valid_levels = {"eli5", "undergrad", "expert"}
-    if level not in valid_levels:
+    if level not in EXPLAIN_LEVELS:
         level = "undergrad"
 
-    system = EXPLAIN_SYSTEM_PROMPT.format(level=level)
-
-    user_message_parts = [f"Explain: {concept}"]
-    if course_name:
-        user_message_parts.append(f"(In the context of: {course_name})")
-    if context:
-        user_message_parts.append(f"\nRelevant context:\n{context[:4000]}")
-
-    user_message = "\n".join(user_message_parts)
-
     try:
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            system=system,
-            messages=[{"role": "user", "content": user_message}],
+        client = get_anthropic_client()
+        response = await client.messages.create(
+            **_explain_request(concept, level, course_name, context, model_override)
         )
 
         explanation = response.content[0].text.strip()
@@ -213,6 +317,92 @@ async def explain_concept(
         }
 
 
+def _explain_cache_key(
+    concept: str,
+    level: str,
+    course_name: str | None,
+    context: str | None,
+    model_override: str | None,
+) -> str:
+    parts = [
+        " ".join(concept.lower().split()),
+        level,
+        " ".join((course_name or "").lower().split()),
+        (context or "")[:4000],
+        model_override or "",
+    ]
+    return "explain:" + hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest()
+
+
+async def cached_explain_concept(
+    redis: Redis,
+    concept: str,
+    level: str = "undergrad",
+    course_name: str | None = None,
+    context: str | None = None,
+    model_override: str | None = None,
+) -> dict[str, Any]:
+    """``explain_concept`` behind a Redis cache keyed on the normalized inputs.
+
+    Only successful explanations are cached; Redis errors fall through to Claude.
+    """
+    if level not in EXPLAIN_LEVELS:
+        level = "undergrad"
+    key = _explain_cache_key(concept, level, course_name, context, model_override)
+
+    try:
+        cached = await redis.get(key)
+    except RedisError as exc:
+        logger.debug("Explain cache read failed: %s", exc)
+        cached = None
+    if cached is not None:
+        return json.loads(cached)
+
+    result = await explain_concept(concept, level, course_name, context, model_override)
+    if "error" not in result:
+        try:
+            await redis.set(key, json.dumps(result), ex=EXPLAIN_CACHE_TTL_SECONDS)
+        except RedisError as exc:
+            logger.debug("Explain cache write failed: %s", exc)
+    return result
+
+
+async def explain_concept_stream(
+    concept: str,
+    level: str = "undergrad",
+    course_name: str | None = None,
+    context: str | None = None,
+    model_override: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Streaming variant of ``explain_concept``.
+
+    Yields ``text`` deltas, then one ``done`` event with 'level' and 'concept'.
+    """
+    if level not in EXPLAIN_LEVELS:
+        level = "undergrad"
+
+    streamed = False
+    try:
+        client = get_anthropic_client()
+        async with client.messages.stream(
+            **_explain_request(concept, level, course_name, context, model_override)
+        ) as stream:
+            async for delta in stream.text_stream:
+                streamed = True
+                yield {"type": "text", "content": delta}
+    except anthropic.APIError as exc:
+        logger.error("Anthropic API error explaining concept: %s", exc)
+        if not streamed:
+            yield {
+                "type": "text",
+                "content": f"Unable to generate explanation for '{concept}' at this time.",
+            }
+        yield {"type": "done", "level": level, "concept": concept, "error": str(exc)}
+        return
+
+    yield {"type": "done", "level": level, "concept": concept}
+
+
 def _extract_follow_up(text: str) -> str | None:
     """Extract the last question from a response as a follow-up prompt."""
     sentences = text.replace("?", "?\n").split("\n")
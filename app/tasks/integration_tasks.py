@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import create_task_engine
+from app.models.lms_connection import LMSConnection
+from app.services.integrations.base import LMSConnector
+from app.services.integrations.canvas import CanvasConnector
+from app.services.integrations.moodle import MoodleConnector
+from app.tasks.worker import celery_app
+
+_CONNECTORS: dict[str, type[LMSConnector]] = {
+    "canvas": CanvasConnector,
+    "moodle": MoodleConnector,
+}
+
+
+async def _load_connection(connection_id: int) -> LMSConnection | None:
+    engine = create_task_engine()
+    try:
+        async with AsyncSession(engine) as session:
+            return await session.get(LMSConnection, connection_id)
+    finally:
+        await engine.dispose()
+
+
+async def _sync_lms(provider: str, user_id: int, connection_id: int) -> dict:
+    result = {
+        "provider": provider,
+        "user_id": user_id,
+        "courses_synced": 0,
+        "assignments_synced": 0,
+        "errors": [],
+    }
+    # Credentials are read here rather than sent through the broker
+    connection = await _load_connection(connection_id)
+    if connection is None or (connection.user_id, connection.provider) != (user_id, provider):
+        result["errors"].append(f"{provider.capitalize()} is not connected.")
+        return result
+
+    # Each task runs in its own event loop (asyncio.run), so it can't borrow
+    # the API's shared client; one client still serves every call in the sync
+    async with httpx.AsyncClient() as client:
+        connector = _CONNECTORS[provider](client)
+        if not await connector.authenticate(connection.credentials):
+            result["errors"].append(f"{provider.capitalize()} authentication failed.")
+            return result
+
+        courses = await connector.fetch_courses()
+        assignments = await connector.fetch_assignments(courses)
+
+    # TODO: upsert courses and assignments into BrainyBuddy DB
+    result["courses_synced"] = len(courses)
+    result["assignments_synced"] = len(assignments)
+    return result
+
+
+@celery_app.task(name="app.tasks.integration_tasks.run_lms_sync")
+def run_lms_sync(provider: str, user_id: int, connection_id: int) -> dict:
+    """Pull courses and assignments from an LMS outside the request cycle."""
+    return asyncio.run(_sync_lms(provider, user_id, connection_id))
@@ -0,0 +1,23 @@
+import asyncio
+from typing import Any
+
+from app.services.tutor.practice_exams import grade_exam
+from app.tasks.worker import celery_app
+
+
+@celery_app.task(bind=True, name="app.tasks.tutor_tasks.run_exam_grading")
+def run_exam_grading(
+    self, user_id: int, exam_id: int, exam_data: dict[str, Any], answers: dict[str, str]
+) -> dict:
+    """Grade a practice exam outside the request cycle, publishing partial results."""
+
+    def report(results: list[dict[str, Any]]) -> None:
+        self.update_state(
+            state="PROGRESS",
+            meta={"user_id": user_id, "exam_id": exam_id, "results": results},
+        )
+
+    # JSON transport turns the integer question ids into strings
+    answers_by_id = {int(q_id): answer for q_id, answer in answers.items()}
+    result = asyncio.run(grade_exam(exam_id, exam_data, answers_by_id, on_progress=report))
+    return {**result, "user_id": user_id}
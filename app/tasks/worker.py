@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 from celery import Celery
 from celery.schedules import crontab
 
@@ -7,6 +9,12 @@ celery_app = Celery(
     "brainybuddy",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
+    # Listed explicitly: autodiscovery only looks for a ``tasks`` module
+    include=[
+        "app.tasks.integration_tasks",
+        "app.tasks.tutor_tasks",
+        "app.tasks.sync_tasks",
+    ],
 )
 
 celery_app.conf.update(
@@ -26,5 +34,16 @@ celery_app.conf.beat_schedule = {
     },
 }
 
-# Auto-discover tasks
-celery_app.autodiscover_tasks(["app.tasks"])
+
+def owned_task_id(*owner: object) -> str:
+    """Task id prefixed with its owner (e.g. user id, exam id).
+
+    Pending and started jobs have no result to check ownership against, so
+    status endpoints check the id itself with ``is_owned_task_id``.
+    """
+    return ":".join([*map(str, owner), uuid4().hex])
+
+
+def is_owned_task_id(task_id: str, *owner: object) -> bool:
+    prefix, _, token = task_id.rpartition(":")
+    return bool(token) and prefix == ":".join(map(str, owner))
@@ -12,12 +12,15 @@ from app.core.deps import get_current_user
 from app.main import app
 from app.models import *  # noqa: F401, F403
 from app.models.user import User
+from app.services.availability_cache import clear_availability_cache
 
 # Use SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-test_session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+test_session_factory = async_sessionmaker(
+    test_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 
 @pytest.fixture(scope="session")
@@ -37,6 +40,8 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
+    # Ids are reused once the tables are recreated
+    clear_availability_cache()
 
 
 @pytest_asyncio.fixture
@@ -0,0 +1,37 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.chat import ChatMessage, ChatSession, MessageRole
+from app.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_chat_history(client: AsyncClient, db_session: AsyncSession, test_user: User):
+    chat_session = ChatSession(user_id=test_user.id)
+    db_session.add(chat_session)
+    await db_session.flush()
+    db_session.add_all([
+        ChatMessage(
+            session_id=chat_session.id,
+            user_id=test_user.id,
+            role=MessageRole.USER,
+            content="Add my essay due Friday",
+        ),
+        ChatMessage(
+            session_id=chat_session.id,
+            user_id=test_user.id,
+            role=MessageRole.ASSISTANT,
+            content="Done!",
+            tool_calls=[{"name": "create_task", "arguments": {"title": "Essay"}}],
+        ),
+    ])
+    await db_session.commit()
+
+    response = await client.get("/api/chat/history", params={"session_id": chat_session.id})
+    assert response.status_code == 200
+    messages = response.json()
+    assert [m["role"] for m in messages] == ["user", "assistant"]
+    assert messages[0]["tool_calls"] == []
+    assert messages[1]["tool_calls"][0]["name"] == "create_task"
+    assert messages[1]["tool_calls"][0]["arguments"] == {"title": "Essay"}
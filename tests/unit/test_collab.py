@@ -0,0 +1,121 @@
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.course import Course
+from app.models.sharing_rule import SharingRule, Visibility
+from app.models.study_block import StudyBlock
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.availability import AvailabilityGridSchema
+from app.services.availability_service import get_availability_grid, update_availability_grid
+from app.services.collab.free_time import find_mutual_free_slots
+
+
+@pytest.mark.asyncio
+async def test_study_group_members(client: AsyncClient, db_session: AsyncSession):
+    friend = User(email="friend@example.com", display_name="Friend", supabase_id="friend-id")
+    db_session.add(friend)
+    await db_session.commit()
+
+    # Create (owner is the first member)
+    response = await client.post("/api/groups", json={"name": "Study Squad"})
+    assert response.status_code == 201
+    group_id = response.json()["id"]
+
+    # Add member
+    response = await client.post(
+        f"/api/groups/{group_id}/members", json={"user_email": "friend@example.com"}
+    )
+    assert response.status_code == 201
+    member = response.json()
+    assert member["display_name"] == "Friend"
+    assert member["email"] == "friend@example.com"
+
+    # Adding twice conflicts
+    response = await client.post(
+        f"/api/groups/{group_id}/members", json={"user_email": "friend@example.com"}
+    )
+    assert response.status_code == 409
+
+    # A second group with only the owner
+    await client.post("/api/groups", json={"name": "Solo"})
+
+    response = await client.get("/api/groups")
+    assert response.status_code == 200
+    counts = {g["name"]: g["member_count"] for g in response.json()}
+    assert counts == {"Study Squad": 2, "Solo": 1}
+
+
+@pytest.mark.asyncio
+async def test_shared_schedule_visibility(
+    client: AsyncClient, db_session: AsyncSession, test_user: User
+):
+    owner = User(email="owner@example.com", display_name="Owner", supabase_id="owner-id")
+    db_session.add(owner)
+    await db_session.flush()
+    course = Course(user_id=owner.id, name="History")
+    db_session.add(course)
+    await db_session.flush()
+    task = Task(
+        user_id=owner.id, course_id=course.id, title="Essay", description="Draft",
+        due_date=datetime(2026, 3, 10),
+    )
+    db_session.add(task)
+    await db_session.flush()
+    db_session.add(StudyBlock(
+        user_id=owner.id, task_id=task.id,
+        start=datetime(2026, 3, 2, 9, 0), end=datetime(2026, 3, 2, 10, 0),
+    ))
+    rule = SharingRule(
+        owner_id=owner.id, shared_with_email=test_user.email, visibility=Visibility.DETAILS
+    )
+    db_session.add(rule)
+    await db_session.commit()
+
+    response = await client.get(f"/api/sharing/{rule.id}/schedule")
+    assert response.status_code == 200
+    assert response.json() == [{
+        "start": "2026-03-02T09:00:00",
+        "end": "2026-03-02T10:00:00",
+        "task_title": "Essay",
+        "course_name": "History",
+        "task_description": None,
+    }]
+
+
+def _free(start_hour: int, end_hour: int) -> list[bool]:
+    return [start_hour * 4 <= slot < end_hour * 4 for slot in range(96)]
+
+
+@pytest.mark.asyncio
+async def test_mutual_free_slots(db_session: AsyncSession, test_user: User):
+    friend = User(email="friend@example.com", display_name="Friend", supabase_id="friend-id")
+    db_session.add(friend)
+    await db_session.commit()
+
+    # Default rules protect 23:00-07:00 as sleep
+    await update_availability_grid(
+        db_session, test_user.id, AvailabilityGridSchema(monday=_free(5, 12), friday=_free(9, 10))
+    )
+    await update_availability_grid(
+        db_session, friend.id, AvailabilityGridSchema(monday=_free(6, 14), friday=_free(9, 18))
+    )
+
+    slots = await find_mutual_free_slots([test_user.id, friend.id], db_session, 60)
+    assert [(s.day, s.start_hour, s.end_hour, s.duration_minutes) for s in slots] == [
+        ("monday", 7, 12, 300),
+        ("friday", 9, 10, 60),
+    ]
+
+    # Updating a grid invalidates the cached masks
+    await update_availability_grid(
+        db_session, friend.id, AvailabilityGridSchema(monday=_free(6, 9))
+    )
+    stored = await get_availability_grid(db_session, friend.id)
+    assert stored.monday == _free(6, 9)
+    assert stored.friday == [False] * 96
+    slots = await find_mutual_free_slots([test_user.id, friend.id], db_session, 60)
+    assert [(s.day, s.start_hour, s.end_hour) for s in slots] == [("monday", 7, 9)]
@@ -0,0 +1,24 @@
+import inspect
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+
+
+def _dependency_calls(dependant):
+    for sub in dependant.dependencies:
+        yield sub.call
+        yield from _dependency_calls(sub)
+
+
+def test_route_dependencies_are_async():
+    """Sync dependencies get offloaded to the threadpool; keep them all async."""
+    sync_deps = set()
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for call in _dependency_calls(route.dependant):
+            fn = call if inspect.isfunction(call) else call.__call__
+            if not (inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn)):
+                sync_deps.add(f"{route.path}: {call!r}")
+    assert not sync_deps, sorted(sync_deps)
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.config import settings
+
 
 @pytest.mark.asyncio
 async def test_health(client: AsyncClient):
@@ -25,3 +27,17 @@ async def test_auth_me(client: AsyncClient):
     data = response.json()
     assert data["email"] == "test@example.com"
     assert data["display_name"] == "Test User"
+
+
+@pytest.mark.asyncio
+async def test_health_pool(client: AsyncClient, monkeypatch):
+    # Hidden unless an ops token is configured and presented
+    assert (await client.get("/health/pool")).status_code == 404
+    monkeypatch.setattr(settings, "OPS_TOKEN", "ops-secret")
+    assert (await client.get("/health/pool")).status_code == 404
+    response = await client.get("/health/pool", headers={"X-Ops-Token": "wrong"})
+    assert response.status_code == 404
+
+    response = await client.get("/health/pool", headers={"X-Ops-Token": "ops-secret"})
+    assert response.status_code == 200
+    assert set(response.json()) == {"size", "checked_in", "checked_out", "overflow"}
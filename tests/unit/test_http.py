@@ -0,0 +1,22 @@
+import httpx
+import pytest
+
+from app.core.http import close_http_client, get_http_client
+
+
+@pytest.mark.asyncio
+async def test_shared_client_does_not_keep_cookies():
+    client = get_http_client()
+    try:
+        url = "https://canvas.example.edu/api/v1/users/self"
+        response = httpx.Response(
+            200,
+            headers={"set-cookie": "_session=abc; Path=/"},
+            request=client.build_request("GET", url),
+        )
+        client.cookies.extract_cookies(response)
+
+        assert not client.cookies
+        assert "cookie" not in client.build_request("GET", url).headers
+    finally:
+        await close_http_client()
@@ -0,0 +1,34 @@
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.encrypted import _fernet
+from app.models.lms_connection import LMSConnection
+from app.models.user import User
+
+
+@pytest.fixture
+def credentials_key(monkeypatch):
+    monkeypatch.setattr(settings, "CREDENTIALS_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    _fernet.cache_clear()
+    yield
+    _fernet.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_lms_credentials_encrypted_at_rest(
+    credentials_key, db_session: AsyncSession, test_user: User
+):
+    credentials = {"base_url": "https://canvas.example.edu", "api_token": "secret-token"}
+    connection = LMSConnection(user_id=test_user.id, provider="canvas", credentials=credentials)
+    db_session.add(connection)
+    await db_session.commit()
+
+    raw = (await db_session.execute(text("SELECT credentials FROM lms_connections"))).scalar_one()
+    assert "secret-token" not in raw
+
+    db_session.expunge_all()
+    loaded = await db_session.get(LMSConnection, connection.id)
+    assert loaded.credentials == credentials
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+@pytest.mark.asyncio
+async def test_upload_text_material(client: AsyncClient):
+    body = "Essay due March 3\n" * 100
+    response = await client.post(
+        "/api/materials/upload",
+        files={"file": ("syllabus.txt", body.encode(), "text/plain")},
+    )
+    assert response.status_code == 201
+    material = response.json()
+    assert material["filename"] == "syllabus.txt"
+    assert material["file_size"] == len(body)
+    assert material["extraction_status"] == "completed"
+
+    response = await client.get("/api/materials")
+    assert [m["id"] for m in response.json()] == [material["id"]]
+
+
+@pytest.mark.asyncio
+async def test_extract_material_stream(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "")
+    response = await client.post(
+        "/api/materials/upload",
+        files={"file": ("notes.txt", b"Quiz on Friday", "text/plain")},
+    )
+    material_id = response.json()["id"]
+
+    response = await client.post(f"/api/materials/extract/{material_id}", params={"stream": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1]["type"] == "result"
+    assert events[-1]["material_id"] == material_id
+    assert events[-1]["raw_text_preview"] == "Quiz on Friday"
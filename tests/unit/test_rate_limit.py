@@ -0,0 +1,57 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.responses import PlainTextResponse
+
+from app.core.rate_limit import TokenBucketMiddleware
+
+
+async def _ok_app(scope, receive, send):
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rejects_after_capacity():
+    app = TokenBucketMiddleware(_ok_app, path="/limited", rate=0.001, capacity=2)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        assert (await ac.post("/limited")).status_code == 200
+        assert (await ac.post("/limited")).status_code == 200
+        response = await ac.post("/limited")
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
+
+        # Other paths are never limited
+        assert (await ac.post("/other")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_evicts_least_recent_client():
+    app = TokenBucketMiddleware(_ok_app, path="/limited", rate=0.001, capacity=1, max_buckets=2)
+
+    async def post(host: str) -> int:
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/limited",
+            "headers": [],
+            "query_string": b"",
+            "client": (host, 1234),
+        }
+        await app(scope, receive, send)
+        return sent[0]["status"]
+
+    assert await post("10.0.0.1") == 200
+    assert await post("10.0.0.2") == 200
+    assert await post("10.0.0.1") == 429
+    # A third client pushes out the least recently seen one (10.0.0.2)
+    assert await post("10.0.0.3") == 200
+    assert len(app.buckets) == 2
+    assert await post("10.0.0.1") == 429
+    assert await post("10.0.0.2") == 200
@@ -1,10 +1,17 @@
 from datetime import datetime, timedelta
 
 import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.course import Course
+from app.models.study_block import StudyBlock
 from app.models.task import Task
+from app.models.user import User
 from app.schemas.availability import AvailabilityGridSchema, SchedulingRulesSchema
-from app.services.scheduler.engine import generate_plan
+from app.services import schedule_service
+from app.services.plan_versioning import rollback_to_version
+from app.services.scheduler.engine import ScheduledBlock, generate_plan
 
 
 def _make_task(task_id: int, title: str, hours: float, due_days: int, difficulty: int = 3) -> Task:
@@ -96,3 +103,100 @@ def test_generate_plan_no_availability():
     rules = SchedulingRulesSchema()
     blocks = generate_plan(tasks, grid, rules)
     assert len(blocks) == 0
+
+
+class _DictRedis:
+    """Just the two commands the preview store uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def getdel(self, key):
+        return self.data.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_plan_preview_round_trip():
+    redis = _DictRedis()
+    start = datetime(2026, 3, 2, 9, 0)
+    blocks = [ScheduledBlock(task_id=7, start=start, end=start + timedelta(hours=1), block_index=2)]
+
+    await schedule_service.save_preview(redis, 1, blocks)
+    restored = await schedule_service.pop_preview(redis, 1)
+
+    assert len(restored) == 1
+    assert restored[0].task_id == 7
+    assert restored[0].start == start
+    assert restored[0].end == start + timedelta(hours=1)
+    assert restored[0].block_index == 2
+    # Confirming consumes the preview
+    assert await schedule_service.pop_preview(redis, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_get_blocks_window_and_titles(
+    client: AsyncClient, db_session: AsyncSession, test_user: User
+):
+    course = Course(user_id=test_user.id, name="History", color="#DC2626")
+    db_session.add(course)
+    await db_session.flush()
+    task = Task(
+        title="Essay", due_date=datetime(2026, 3, 10), user_id=test_user.id, course_id=course.id
+    )
+    db_session.add(task)
+    await db_session.flush()
+    for day in (2, 3, 4):
+        start = datetime(2026, 3, day, 9, 0)
+        db_session.add(StudyBlock(
+            user_id=test_user.id, task_id=task.id, start=start, end=start + timedelta(hours=1)
+        ))
+    await db_session.commit()
+
+    response = await client.get("/api/schedule/blocks", params={
+        "start": "2026-03-03T00:00:00", "end": "2026-03-03T23:59:00",
+    })
+    assert response.status_code == 200
+    blocks = response.json()
+    assert len(blocks) == 1
+    assert blocks[0]["start"] == "2026-03-03T09:00:00"
+    assert blocks[0]["task_title"] == "Essay"
+    assert blocks[0]["course_name"] == "History"
+    assert blocks[0]["course_color"] == "#DC2626"
+
+    response = await client.get("/api/schedule/blocks")
+    assert [b["start"][:10] for b in response.json()] == ["2026-03-02", "2026-03-03", "2026-03-04"]
+
+
+@pytest.mark.asyncio
+async def test_confirm_plan_keeps_pinned_and_rolls_back(db_session: AsyncSession, test_user: User):
+    task = Task(title="Essay", due_date=datetime(2026, 3, 10), user_id=test_user.id)
+    db_session.add(task)
+    await db_session.flush()
+    pinned_start = datetime(2026, 3, 2, 9, 0)
+    db_session.add_all([
+        StudyBlock(user_id=test_user.id, task_id=task.id, start=pinned_start,
+                   end=pinned_start + timedelta(hours=1), is_pinned=True),
+        StudyBlock(user_id=test_user.id, task_id=task.id, start=datetime(2026, 3, 5, 9, 0),
+                   end=datetime(2026, 3, 5, 10, 0)),
+    ])
+    await db_session.commit()
+
+    new_blocks = [
+        ScheduledBlock(task_id=task.id, start=pinned_start, end=pinned_start + timedelta(hours=1)),
+        ScheduledBlock(task_id=task.id, start=datetime(2026, 3, 3, 9, 0),
+                       end=datetime(2026, 3, 3, 10, 0), block_index=1),
+    ]
+    first_version = await schedule_service.confirm_plan(db_session, test_user.id, new_blocks)
+
+    blocks = await schedule_service.get_current_blocks(db_session, test_user.id)
+    assert [(b.start.day, b.is_pinned) for b in blocks] == [(2, True), (3, False)]
+    assert blocks[1].plan_version_id == first_version
+
+    # The first version snapshotted the pre-confirm blocks
+    await rollback_to_version(db_session, test_user.id, first_version)
+    await db_session.commit()
+    blocks = await schedule_service.get_current_blocks(db_session, test_user.id)
+    assert [(b.start.day, b.is_pinned) for b in blocks] == [(2, True), (5, False)]
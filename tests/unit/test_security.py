@@ -0,0 +1,110 @@
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwk, jwt
+
+from app.core import security
+
+KID = "test-kid"
+
+
+@pytest.fixture
+def signing_pem(monkeypatch):
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_jwk = jwk.construct(pem, algorithm="ES256").public_key().to_dict()
+    public_jwk.update({"kid": KID, "alg": "ES256"})
+    keys = security._construct_keys({"keys": [public_jwk]})
+    monkeypatch.setattr(security, "_jwks_cache", (keys, time.monotonic()))
+    return pem
+
+
+def _token(pem: str, **claims) -> str:
+    payload = {"sub": "user-1", "aud": "authenticated", "exp": int(time.time()) + 60, **claims}
+    return jwt.encode(payload, pem, algorithm="ES256", headers={"kid": KID})
+
+
+@pytest.mark.asyncio
+async def test_verify_valid_token(signing_pem):
+    payload = await security.verify_supabase_token(_token(signing_pem, email="a@b.c"))
+    assert payload is not None
+    assert payload["sub"] == "user-1"
+    assert payload["email"] == "a@b.c"
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_expired_token(signing_pem):
+    token = _token(signing_pem, exp=int(time.time()) - 10)
+    assert await security.verify_supabase_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_verify_requires_sub(signing_pem):
+    payload = {"aud": "authenticated", "exp": int(time.time()) + 60}
+    token = jwt.encode(payload, signing_pem, algorithm="ES256", headers={"kid": KID})
+    assert await security.verify_supabase_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetches_jwks(signing_pem, monkeypatch):
+    rotated = jwk.construct(signing_pem, algorithm="ES256").public_key().to_dict()
+    rotated.update({"kid": "rotated-kid", "alg": "ES256"})
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"keys": [rotated]}))
+    )
+    monkeypatch.setattr(security, "get_http_client", lambda: client)
+    monkeypatch.setattr(security.settings, "SUPABASE_URL", "https://project.supabase.co")
+    # Cached keys are old enough that an unknown kid may trigger a refetch
+    keys, _ = security._jwks_cache
+    stale = time.monotonic() - security.JWKS_MIN_REFETCH_SECONDS - 1
+    monkeypatch.setattr(security, "_jwks_cache", (keys, stale))
+
+    payload = {"sub": "user-1", "aud": "authenticated", "exp": int(time.time()) + 60}
+    token = jwt.encode(payload, signing_pem, algorithm="ES256", headers={"kid": "rotated-kid"})
+    assert (await security.verify_supabase_token(token))["sub"] == "user-1"
+    assert "rotated-kid" in security._jwks_cache[0]
+
+
+@pytest.mark.asyncio
+async def test_verified_payload_is_cached_until_exp(signing_pem, monkeypatch):
+    token = _token(signing_pem, exp=int(time.time()) + 2)
+    assert await security.verify_supabase_token(token) is not None
+
+    # Served from the verification cache without touching the keys
+    monkeypatch.setattr(security, "_jwks_cache", ({}, time.monotonic()))
+    assert await security.verify_supabase_token(token) is not None
+
+    # ...but never past the token's own exp
+    later = time.time() + 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert await security.verify_supabase_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_unusable_jwk_is_skipped(signing_pem, monkeypatch):
+    good = jwk.construct(signing_pem, algorithm="ES256").public_key().to_dict()
+    good.update({"kid": KID, "alg": "ES256"})
+    jwks = {
+        "keys": [
+            {"kid": "new-alg", "kty": "OKP", "crv": "Ed25519", "x": "AA", "alg": "EdDSA"},
+            {"kid": "bad-rsa", "kty": "RSA", "alg": "RS256"},
+            good,
+        ]
+    }
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=jwks))
+    )
+    monkeypatch.setattr(security, "get_http_client", lambda: client)
+    monkeypatch.setattr(security.settings, "SUPABASE_URL", "https://project.supabase.co")
+    monkeypatch.setattr(security, "_jwks_cache", None)
+
+    payload = await security.verify_supabase_token(_token(signing_pem))
+    assert payload["sub"] == "user-1"
+    assert set(security._jwks_cache[0]) == {KID}
@@ -79,3 +79,64 @@ async def test_delete_task(client: AsyncClient):
 
     get = await client.get(f"/api/tasks/{task_id}")
     assert get.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_task_tag_ids(client: AsyncClient):
+    tag_a = (await client.post("/api/tags", json={"name": "exam"})).json()["id"]
+    tag_b = (await client.post("/api/tags", json={"name": "lab"})).json()["id"]
+    create = await client.post("/api/tasks", json={
+        "title": "Tagged",
+        "due_date": "2026-03-15T23:59:00",
+        "tag_ids": [tag_a, tag_b],
+    })
+    task_id = create.json()["id"]
+
+    response = await client.get(f"/api/tasks/{task_id}")
+    assert sorted(response.json()["tag_ids"]) == sorted([tag_a, tag_b])
+
+    response = await client.post(f"/api/tasks/{task_id}/add-time", json={"additional_hours": 1.5})
+    assert sorted(response.json()["tag_ids"]) == sorted([tag_a, tag_b])
+
+    response = await client.patch(f"/api/tasks/{task_id}", json={"tag_ids": [tag_b]})
+    assert response.json()["tag_ids"] == [tag_b]
+
+    response = await client.post(f"/api/tasks/{task_id}/complete")
+    assert response.json()["tag_ids"] == [tag_b]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_etag(client: AsyncClient):
+    await client.post("/api/tasks", json={"title": "Poll me", "due_date": "2026-03-15T23:59:00"})
+    response = await client.get("/api/tasks")
+    etag = response.headers["etag"]
+
+    response = await client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # A different page is a different representation
+    response = await client.get("/api/tasks", params={"limit": 1}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    await client.post("/api/tasks", json={"title": "New", "due_date": "2026-03-16T23:59:00"})
+    response = await client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_pagination_total(client: AsyncClient):
+    for day in (10, 11, 12):
+        await client.post("/api/tasks", json={
+            "title": f"T{day}",
+            "due_date": f"2026-03-{day}T23:59:00",
+        })
+
+    data = (await client.get("/api/tasks", params={"limit": 2})).json()
+    assert [t["title"] for t in data["items"]] == ["T10", "T11"]
+    assert data["total"] == 3
+
+    data = (await client.get("/api/tasks", params={"offset": 5})).json()
+    assert data["items"] == []
+    assert data["total"] == 3
@@ -0,0 +1,68 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_time_log_totals(client: AsyncClient):
+    task_ids = []
+    for title in ("Essay", "Lab"):
+        response = await client.post("/api/tasks", json={
+            "title": title,
+            "due_date": "2026-03-15T23:59:00",
+        })
+        task_ids.append(response.json()["id"])
+
+    for minutes in (30, 45):
+        await client.post("/api/time-logs", json={
+            "task_id": task_ids[0],
+            "start": "2026-03-01T09:00:00",
+            "duration_minutes": minutes,
+        })
+
+    response = await client.get("/api/time-logs/totals", params={"task_ids": task_ids})
+    assert response.status_code == 200
+    totals = response.json()
+    assert totals[str(task_ids[0])]["total_minutes"] == 75
+    assert totals[str(task_ids[0])]["total_hours"] == 1.25
+    assert totals[str(task_ids[1])]["total_minutes"] == 0
+
+    response = await client.get(f"/api/time-logs/total/{task_ids[0]}")
+    assert response.json()["total_minutes"] == 75
+
+
+@pytest.mark.asyncio
+async def test_estimation_multipliers(client: AsyncClient):
+    response = await client.post("/api/courses", json={"name": "History"})
+    course_id = response.json()["id"]
+
+    # Estimated 2h each; logged 3h and 1h -> ratios 1.5 and 0.5, then 4h -> 2.0
+    for title, minutes, course in (
+        ("Essay", (120, 60), None),
+        ("Lab", (60,), None),
+        ("Reading", (), None),
+        ("Paper", (240,), course_id),
+    ):
+        response = await client.post("/api/tasks", json={
+            "title": title,
+            "due_date": "2026-03-15T23:59:00",
+            "estimated_hours": 2,
+            "course_id": course,
+        })
+        task_id = response.json()["id"]
+        for duration in minutes:
+            await client.post("/api/time-logs", json={
+                "task_id": task_id,
+                "start": "2026-03-01T09:00:00",
+                "duration_minutes": duration,
+            })
+        await client.post(f"/api/tasks/{task_id}/complete")
+
+    response = await client.get("/api/insights/multipliers")
+    assert response.status_code == 200
+    assert sorted(response.json(), key=lambda m: m["course_id"] or 0) == [
+        {"course_id": None, "task_type": "assignment", "multiplier": 1.0, "sample_count": 2},
+        {"course_id": course_id, "task_type": "assignment", "multiplier": 2.0, "sample_count": 1},
+    ]
+
+    response = await client.post(f"/api/insights/multipliers/refresh/{course_id}")
+    assert response.json() == {"course_id": course_id, "multiplier": 2.0}
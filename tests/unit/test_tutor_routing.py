@@ -0,0 +1,14 @@
+from app.core.config import settings
+from app.services.tutor.routing import pick_model
+
+
+def test_pick_model():
+    simple, default = settings.ANTHROPIC_MODEL_SIMPLE, settings.ANTHROPIC_MODEL_DEFAULT
+
+    assert pick_model(hint_level="nudge", question="What is entropy?") == simple
+    assert pick_model(hint_level="nudge", question="x" * 300) == default
+    assert pick_model(hint_level="full_explanation", question="What is entropy?") == default
+    assert pick_model(level="eli5") == simple
+    assert pick_model(level="expert") == default
+    assert pick_model(level="eli5", override="default") == default
+    assert pick_model(level="expert", override="simple") == simple
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+from app.tasks.worker import is_owned_task_id, owned_task_id
+
+# Run in a fresh interpreter: other tests import the task modules themselves,
+# which would register the tasks regardless of the worker's configuration
+_WORKER_TASKS = """
+from app.tasks.worker import celery_app
+
+celery_app.loader.import_default_modules()
+print("\\n".join(celery_app.tasks))
+"""
+
+
+def test_worker_registers_task_modules():
+    out = subprocess.run(
+        [sys.executable, "-c", _WORKER_TASKS], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert "app.tasks.integration_tasks.run_lms_sync" in out
+    assert "app.tasks.tutor_tasks.run_exam_grading" in out
+    assert "app.tasks.sync_tasks.poll_google_calendar_changes" in out
+
+
+def test_owned_task_id():
+    task_id = owned_task_id(7, "canvas")
+    assert is_owned_task_id(task_id, 7, "canvas")
+    assert not is_owned_task_id(task_id, 7, "moodle")
+    assert not is_owned_task_id(task_id, 17, "canvas")
+    assert not is_owned_task_id(task_id.replace("7:", "8:", 1), 7, "canvas")
+    assert not is_owned_task_id("7:canvas:", 7, "canvas")